@@ -6,20 +6,12 @@ the communication between all three agent types.
 """
 
 import asyncio
+import io
 import logging
-
-# This demo depends on a separate test module that might not exist in every environment.
-# Provide built-in fallbacks if unavailable so the demo remains runnable offline.
-try:
-    from tests.test_agent_flow import (
-        ResourceObservingAgent as _ResourceObservingAgent,
-        ColonyCoreAgent as _ColonyCoreAgent,
-        GameCommandsAgent as _GameCommandsAgent,
-    )
-except Exception:  # pragma: no cover - demo-only fallback
-    _ResourceObservingAgent = None
-    _ColonyCoreAgent = None
-    _GameCommandsAgent = None
+import os
+import sys
+import types
+from typing import TextIO, Tuple
 
 from src.oni_ai_agents.core.agent import Agent, AgentMessage
 from src.oni_ai_agents.core.agent_types import AgentType
@@ -118,75 +110,134 @@ class _FallbackGameCommandsAgent(Agent):
             await self.process_input(message.content)
 
 
-# Choose test-provided classes if present, otherwise fall back
-ResourceObservingAgent = _ResourceObservingAgent or _FallbackResourceObservingAgent
-ColonyCoreAgent = _ColonyCoreAgent or _FallbackColonyCoreAgent
-GameCommandsAgent = _GameCommandsAgent or _FallbackGameCommandsAgent
+def _load_agent_classes() -> Tuple[type, type, type]:
+    """Return the (resource, core, commands) agent classes for the demo.
+
+    The test module is imported only when the demo actually runs, so simply
+    importing or collecting this file never pulls it in. The three classes are
+    imported together, so one identity check covers them all.
+    """
+    # This demo depends on a separate test module that might not exist in every environment.
+    # Provide built-in fallbacks if unavailable so the demo remains runnable offline.
+    try:
+        from tests.test_agent_flow import (
+            ResourceObservingAgent as _ResourceObservingAgent,
+            ColonyCoreAgent as _ColonyCoreAgent,
+            GameCommandsAgent as _GameCommandsAgent,
+        )
+    except Exception:  # pragma: no cover - demo-only fallback
+        _ResourceObservingAgent = None
+        _ColonyCoreAgent = None
+        _GameCommandsAgent = None
+
+    # Choose test-provided classes if present, otherwise fall back
+    if None in (_ResourceObservingAgent, _ColonyCoreAgent, _GameCommandsAgent):
+        return (
+            _FallbackResourceObservingAgent,
+            _FallbackColonyCoreAgent,
+            _FallbackGameCommandsAgent,
+        )
+    return _ResourceObservingAgent, _ColonyCoreAgent, _GameCommandsAgent
+
+
+# Shared, read-only inputs so repeated demo runs don't rebuild the literals
+_MODEL_CONFIG = types.MappingProxyType({"delay": 0.05})
+_GAME_STATE = {
+    "resources": {"food": 25, "oxygen": 35, "power": 80, "water": 10},
+    "duplicants": {"count": 8, "health": "good"},
+    "threats": ["heat", "disease"],
+}
 
 
 async def run_agent_flow_demo():
     """Run a demonstration of the complete agent flow."""
 
-    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-    print("🤖 ONI AI Agents - Complete Flow Demo")
-    print("=" * 50)
+    # Agent loggers are named "Agent.<id>", so their shared parent scopes the level
+    agent_logger = logging.getLogger("Agent")
+    saved_level = agent_logger.level
+    if os.getenv("FAST_TESTS") == "1":
+        # Under the test suite, skip per-message INFO formatting for this run only
+        agent_logger.setLevel(logging.WARNING)
+    else:
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Print live on a terminal; otherwise buffer and emit with a single write
+    interactive = sys.stdout.isatty()
+    out = sys.stdout if interactive else io.StringIO()
+    try:
+        await _run_flow(out)
+    finally:
+        agent_logger.setLevel(saved_level)
+        if not interactive:
+            sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
+async def _run_flow(out: TextIO) -> None:
+    """Drive the three-agent flow, writing progress to `out`."""
+    print("🤖 ONI AI Agents - Complete Flow Demo", file=out)
+    print("=" * 50, file=out)
+    ResourceObservingAgent, ColonyCoreAgent, GameCommandsAgent = _load_agent_classes()
 
     # Create the three agents
-    print("\n📋 Creating agents...")
-    resource_agent = ResourceObservingAgent(agent_id="resource_observer", model_provider="local", model_config={"delay": 0.05})
-    core_agent = ColonyCoreAgent(agent_id="colony_core", model_provider="local", model_config={"delay": 0.05})
-    commands_agent = GameCommandsAgent(agent_id="commands_agent", model_provider="local", model_config={"delay": 0.05})
+    print("\n📋 Creating agents...", file=out)
+    resource_agent = ResourceObservingAgent(agent_id="resource_observer", model_provider="local", model_config=_MODEL_CONFIG)
+    core_agent = ColonyCoreAgent(agent_id="colony_core", model_provider="local", model_config=_MODEL_CONFIG)
+    commands_agent = GameCommandsAgent(agent_id="commands_agent", model_provider="local", model_config=_MODEL_CONFIG)
 
     # Connect the agents
-    print("🔗 Connecting agents...")
-    resource_agent.connect_to_agent(core_agent)
-    core_agent.connect_to_agent(commands_agent)
-    commands_agent.connect_to_agent(core_agent)
+    print("🔗 Connecting agents...", file=out)
+    # Connections are bidirectional, so the core agent links to both peers in one call
+    core_agent.connect_to_agents(resource_agent, commands_agent)
 
     # Start all agents
-    print("🚀 Starting agents...")
-    await resource_agent.start()
-    await core_agent.start()
-    await commands_agent.start()
+    print("🚀 Starting agents...", file=out)
+    await asyncio.gather(resource_agent.start(), core_agent.start(), commands_agent.start())
 
     # Simulate a critical game state
-    print("\n🎮 Simulating game state...")
-    game_state = {
-        "resources": {"food": 25, "oxygen": 35, "power": 80, "water": 10},
-        "duplicants": {"count": 8, "health": "good"},
-        "threats": ["heat", "disease"],
-    }
-    print(f"Game State: {game_state}")
+    print("\n🎮 Simulating game state...", file=out)
+    game_state = _GAME_STATE
+    print(f"Game State: {game_state}", file=out)
 
     # Step 1: Resource Analysis
-    print("\n🔄 Step 1: Resource Analysis")
+    print("\n🔄 Step 1: Resource Analysis", file=out)
     await resource_agent.send_message("colony_core", "request_resource_analysis", {"game_state": game_state})
     await asyncio.sleep(0.3)
 
     # Step 2: Strategic Decision
-    print("\n🔄 Step 2: Strategic Decision")
+    print("\n🔄 Step 2: Strategic Decision", file=out)
     await asyncio.sleep(0.3)
 
     # Step 3: Command Execution
-    print("\n🔄 Step 3: Command Execution")
+    print("\n🔄 Step 3: Command Execution", file=out)
     await asyncio.sleep(0.3)
 
-    # Final Status Report
-    print("\n📈 Final Status Report")
-    print("-" * 30)
-    print(f"Resource observations: {len(getattr(resource_agent, 'observations', []))}")
-    print(f"Strategic decisions: {len(getattr(core_agent, 'decisions', []))}")
-    print(f"Commands executed: {len(getattr(commands_agent, 'executed_commands', []))}")
+    # Final Status Report, built from one status snapshot per agent and emitted in one write
+    r, c, x = resource_agent.get_status(), core_agent.get_status(), commands_agent.get_status()
+    total = r["message_queue_size"] + c["message_queue_size"] + x["message_queue_size"]
+    report = (
+        f"\n📈 Final Status Report\n"
+        f"{'-' * 30}\n"
+        f"Resource observations: {len(getattr(resource_agent, 'observations', []))}\n"
+        f"Strategic decisions: {len(getattr(core_agent, 'decisions', []))}\n"
+        f"Commands executed: {len(getattr(commands_agent, 'executed_commands', []))}\n"
+        f"Messages received: {total}"
+    )
+    print(report, file=out)
 
     # Stop all agents
-    print("\n🛑 Stopping agents...")
-    await resource_agent.stop()
-    await core_agent.stop()
-    await commands_agent.stop()
+    print("\n🛑 Stopping agents...", file=out)
+    await asyncio.gather(resource_agent.stop(), core_agent.stop(), commands_agent.stop())
 
-    print("\n✅ Agent flow demo completed successfully!")
+    print("\n✅ Agent flow demo completed successfully!", file=out)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_agent_flow_demo()) 
\ No newline at end of file
+    # Use uvloop's faster event loop when it is available
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(run_agent_flow_demo())
\ No newline at end of file
@@ -13,12 +13,20 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from PIL import Image
-
 from ..core.agent import Agent
 from ..core.agent_types import AgentType
 from ..models.vision_model_factory import VisionModelFactory
 
+_BASE_PROMPT = "Analyze this Oxygen Not Included base screenshot and provide a concise summary."
+
+# Prompts are fixed per analysis type, so build them once at import
+_ANALYSIS_PROMPTS: Dict[str, str] = {
+    "base_overview": f"{_BASE_PROMPT} Focus on: overall base state and layout, key resources (food, oxygen, power, water), any obvious issues or threats, notable buildings or structures.",
+    "resource_analysis": f"{_BASE_PROMPT} Focus specifically on: food storage and production, oxygen generation and distribution, power generation and consumption, water systems, resource efficiency and bottlenecks.",
+    "threat_assessment": f"{_BASE_PROMPT} Focus specifically on: immediate dangers or threats, heat management issues, disease outbreaks, resource shortages, structural problems, duplicant health and stress.",
+    "efficiency_analysis": f"{_BASE_PROMPT} Focus specifically on: production efficiency, idle duplicants, resource waste, optimization opportunities, workflow bottlenecks, automation potential.",
+}
+
 
 @dataclass
 class ImageAnalysisResult:
@@ -62,6 +70,11 @@ class ImageObserverAgent(Agent):
             **kwargs
         )
         
+        # Most recently validated image and its hash, so re-analysing the same
+        # screenshot skips PIL verification and hashing
+        self._last_image_data: Optional[bytes] = None
+        self._last_image_hash: Optional[str] = None
+        
         # Initialize vision model if provider is specified
         if model_provider:
             self._initialize_vision_model()
@@ -108,15 +121,18 @@ class ImageObserverAgent(Agent):
         if not image_data:
             raise ValueError("No image data provided")
         
-        # Validate image format
-        self._validate_image_format(image_data)
+        # Validate image format and generate hash for tracking (cached per image)
+        if image_data == self._last_image_data:
+            image_hash = self._last_image_hash
+        else:
+            self._validate_image_format(image_data)
+            image_hash = self._hash_image(image_data)
+            self._last_image_data = image_data
+            self._last_image_hash = image_hash
         
         # Get analysis type
         analysis_type = input_data.get("analysis_type", "base_overview")
         
-        # Generate image hash for tracking
-        image_hash = self._hash_image(image_data)
-        
         # Analyze image with AI model
         if not self.vision_model:
             raise RuntimeError("No vision model available for image analysis")
@@ -169,6 +185,9 @@ class ImageObserverAgent(Agent):
     
     def _validate_image_format(self, image_data: bytes) -> None:
         """Validate that the image data is in a supported format."""
+        # Imported here so loading the agent module does not pull in Pillow
+        from PIL import Image
+        
         try:
             # Try to open with PIL to validate format
             image = Image.open(io.BytesIO(image_data))
@@ -183,7 +202,8 @@ class ImageObserverAgent(Agent):
     
     def _hash_image(self, image_data: bytes) -> str:
         """Generate SHA-256 hash of image data for tracking changes."""
-        return hashlib.sha256(image_data).hexdigest()
+        # The hash only tracks changes, so skip FIPS security-policy overhead
+        return hashlib.sha256(image_data, usedforsecurity=False).hexdigest()
     
     async def _analyze_image_with_ai(self, image_data: bytes, analysis_type: str) -> Tuple[str, Optional[float]]:
         """
@@ -210,24 +230,10 @@ class ImageObserverAgent(Agent):
         else:
             return str(result), None
     
-    def _create_analysis_prompt(self, analysis_type: str) -> str:
+    @staticmethod
+    def _create_analysis_prompt(analysis_type: str) -> str:
         """Create analysis prompt based on type."""
-        base_prompt = "Analyze this Oxygen Not Included base screenshot and provide a concise summary."
-        
-        if analysis_type == "base_overview":
-            return f"{base_prompt} Focus on: overall base state and layout, key resources (food, oxygen, power, water), any obvious issues or threats, notable buildings or structures."
-        
-        elif analysis_type == "resource_analysis":
-            return f"{base_prompt} Focus specifically on: food storage and production, oxygen generation and distribution, power generation and consumption, water systems, resource efficiency and bottlenecks."
-        
-        elif analysis_type == "threat_assessment":
-            return f"{base_prompt} Focus specifically on: immediate dangers or threats, heat management issues, disease outbreaks, resource shortages, structural problems, duplicant health and stress."
-        
-        elif analysis_type == "efficiency_analysis":
-            return f"{base_prompt} Focus specifically on: production efficiency, idle duplicants, resource waste, optimization opportunities, workflow bottlenecks, automation potential."
-        
-        else:
-            return base_prompt
+        return _ANALYSIS_PROMPTS.get(analysis_type, _BASE_PROMPT)
     
     def _format_output(self, result: ImageAnalysisResult) -> Dict[str, Any]:
         """Format the analysis result for output."""
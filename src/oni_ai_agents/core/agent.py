@@ -38,6 +38,7 @@ class Agent(ABC):
         agent_type: AgentType,
         model_provider: Optional[str] = None,
         model_config: Optional[Dict[str, Any]] = None,
+        model: Optional[Any] = None,
         **kwargs
     ):
         """
@@ -48,6 +49,8 @@ class Agent(ABC):
             agent_type: Type of agent (observing, core, commands)
             model_provider: AI model provider (openai, anthropic, local, etc.)
             model_config: Configuration for the AI model
+            model: Optional pre-built model instance to reuse instead of
+                creating one from `model_provider`/`model_config`
         """
         self.agent_id = agent_id
         self.agent_type = agent_type
@@ -61,9 +64,13 @@ class Agent(ABC):
         # State
         self.is_active = False
         self.logger = logging.getLogger(f"Agent.{agent_id}")
+        # Status snapshot, rebuilt lazily after state-changing events
+        self._status_cache: Optional[Dict[str, Any]] = None
         
-        # Initialize model connection if provider is specified
-        if model_provider:
+        # Reuse a supplied model, else initialize one if provider is specified
+        if model is not None:
+            self.model = model
+        elif model_provider:
             self._initialize_model()
     
     def _initialize_model(self) -> None:
@@ -79,12 +86,14 @@ class Agent(ABC):
     async def start(self) -> None:
         """Start the agent."""
         self.is_active = True
+        self._invalidate_status()
         self.logger.info(f"Agent {self.agent_id} started")
         await self._on_start()
     
     async def stop(self) -> None:
         """Stop the agent."""
         self.is_active = False
+        self._invalidate_status()
         self.logger.info(f"Agent {self.agent_id} stopped")
         await self._on_stop()
     
@@ -105,21 +114,53 @@ class Agent(ABC):
     async def receive_message(self, message: AgentMessage) -> None:
         """Receive a message from another agent."""
         self.message_queue.append(message)
-        self.logger.debug(f"Received message from {message.sender_id}: {message.message_type}")
+        self._invalidate_status()
+        # Skip formatting the per-message debug line unless it will be emitted
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Received message from {message.sender_id}: {message.message_type}")
         await self._process_message(message)
     
+    def peek_message(self, index: int = -1) -> AgentMessage:
+        """
+        Return a received message without removing it.
+        
+        Args:
+            index: Position in the mailbox (defaults to the most recent message)
+            
+        Returns:
+            The message at `index`
+        """
+        return self.message_queue[index]
+    
     def connect_to_agent(self, agent: 'Agent') -> None:
         """Connect to another agent for direct communication."""
         self.connected_agents[agent.agent_id] = agent
         agent.connected_agents[self.agent_id] = self
+        self._invalidate_status()
+        agent._invalidate_status()
         self.logger.info(f"Connected to agent {agent.agent_id}")
     
+    def connect_to_agents(self, *agents: 'Agent') -> None:
+        """Connect to several agents at once, invalidating status only once."""
+        if not agents:
+            return
+        self.connected_agents.update({agent.agent_id: agent for agent in agents})
+        for agent in agents:
+            agent.connected_agents[self.agent_id] = self
+            agent._invalidate_status()
+        self._invalidate_status()
+        self.logger.info(
+            f"Connected to agents {', '.join(agent.agent_id for agent in agents)}"
+        )
+    
     def disconnect_from_agent(self, agent_id: str) -> None:
         """Disconnect from an agent."""
         if agent_id in self.connected_agents:
             agent = self.connected_agents.pop(agent_id)
             if self.agent_id in agent.connected_agents:
                 agent.connected_agents.pop(self.agent_id)
+            self._invalidate_status()
+            agent._invalidate_status()
             self.logger.info(f"Disconnected from agent {agent_id}")
     
     @abstractmethod
@@ -146,13 +187,25 @@ class Agent(ABC):
     async def _process_message(self, message: AgentMessage) -> None:
         """Process a received message."""
     
+    def _invalidate_status(self) -> None:
+        """Drop the cached status snapshot so the next call rebuilds it."""
+        self._status_cache = None
+    
     def get_status(self) -> Dict[str, Any]:
-        """Get the current status of the agent."""
-        return {
-            "agent_id": self.agent_id,
-            "agent_type": self.agent_type.name.lower(),
-            "is_active": self.is_active,
-            "model_provider": self.model_provider,
-            "connected_agents": list(self.connected_agents.keys()),
-            "message_queue_size": len(self.message_queue)
-        } 
\ No newline at end of file
+        """Get the current status of the agent.
+        
+        The snapshot is cached and only rebuilt after start/stop,
+        connect/disconnect or a received message.
+        """
+        if self._status_cache is None:
+            self._status_cache = {
+                "agent_id": self.agent_id,
+                "agent_type": self.agent_type.name.lower(),
+                "is_active": self.is_active,
+                "model_provider": self.model_provider,
+                "connected_agents": list(self.connected_agents.keys()),
+                "message_queue_size": len(self.message_queue)
+            }
+        status = dict(self._status_cache)
+        status["connected_agents"] = list(status["connected_agents"])
+        return status 
\ No newline at end of file
@@ -7,7 +7,7 @@ from .base_model import BaseModel
 from .local_model import LocalModel
 from .model_factory import ModelFactory
 from .openai_model import OpenAIModel
-from .rate_limiter import RateLimitConfig, RateLimitedModel, RateLimiter
+from .rate_limiter import RateLimitConfig, RateLimitedModel, RateLimiter, RateLimitExceeded
 
 __all__ = [
     "ModelFactory",
@@ -17,5 +17,6 @@ __all__ = [
     "LocalModel",
     "RateLimiter",
     "RateLimitConfig", 
-    "RateLimitedModel"
+    "RateLimitedModel",
+    "RateLimitExceeded"
 ] 
\ No newline at end of file
@@ -16,6 +16,9 @@ class LocalModel(BaseModel):
     for testing the agent system without requiring external APIs.
     """
     
+    # Artificial delay used when the config does not specify one
+    _DEFAULT_DELAY: float = 0.1
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize local model.
@@ -24,10 +27,11 @@ class LocalModel(BaseModel):
             config: Configuration dictionary with:
                 - responses: Optional predefined responses
                 - delay: Optional artificial delay in seconds
+                  (defaults to ``_DEFAULT_DELAY``)
         """
         super().__init__(config)
         self.responses = config.get("responses", {})
-        self.delay = config.get("delay", 0.1)
+        self.delay = config.get("delay", self._DEFAULT_DELAY)
         self.response_count = 0
     
     async def initialize(self) -> bool:
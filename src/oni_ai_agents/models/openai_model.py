@@ -53,6 +53,8 @@ class OpenAIModel(BaseModel):
             self.request_timeout: Optional[float] = float(rt) if rt is not None else None
         except Exception:
             self.request_timeout = None
+        # Low token defaults for test runs; read once rather than on every request
+        self._fast_mode = os.getenv("FAST_TESTS", "0") == "1"
         self._client = None  # Lazy client
 
     async def _get_client(self):
@@ -171,8 +173,7 @@ class OpenAIModel(BaseModel):
         if not self.force_chat and hasattr(client, "responses"):
             try:
                 # Honor low token defaults when FAST_TESTS=1 if no explicit limit provided
-                fast_tests = os.getenv("FAST_TESTS", "0") == "1"
-                default_test_tokens = 64 if fast_tests else None
+                default_test_tokens = 64 if self._fast_mode else None
                 resp_kw_max = kwargs.get("max_output_tokens")
                 resp_tokens = max_tokens if max_tokens is not None else (
                     resp_kw_max if resp_kw_max is not None else default_test_tokens
@@ -236,8 +237,7 @@ class OpenAIModel(BaseModel):
         if hasattr(client, "chat") and hasattr(client.chat, "completions"):
             try:
                 # Honor low token defaults when FAST_TESTS=1 if no explicit limit provided
-                fast_tests = os.getenv("FAST_TESTS", "0") == "1"
-                default_test_tokens = 64 if fast_tests else None
+                default_test_tokens = 64 if self._fast_mode else None
                 chat_kw_max = kwargs.get("max_tokens")
                 chat_tokens = max_tokens if max_tokens is not None else (
                     chat_kw_max if chat_kw_max is not None else default_test_tokens
@@ -6,10 +6,13 @@ and ensure fair usage across multiple agents.
 """
 
 import asyncio
+import math
 import time
+from array import array
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, Optional
 
 
 class RateLimitStrategy(Enum):
@@ -21,7 +24,7 @@ class RateLimitStrategy(Enum):
     LEAKY_BUCKET = "leaky_bucket"       # Leaky bucket algorithm
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateLimitConfig:
     """Configuration for rate limiting."""
     
@@ -34,6 +37,60 @@ class RateLimitConfig:
     max_retries: int = 3
 
 
+class RateLimitExceeded(Exception):
+    """Raised when a rate-limited call cannot acquire permission in time."""
+
+
+class _SlidingCounter:
+    """
+    Count events over a trailing window using a ring buffer of time buckets.
+    
+    Recording and counting are O(1) amortized with constant memory, instead of
+    filtering a growing list of timestamps on every check.
+    """
+    
+    __slots__ = ("_buckets", "_resolution", "_last_bucket", "total")
+    
+    def __init__(self, window_seconds: int, resolution: int = 1):
+        """
+        Args:
+            window_seconds: Length of the trailing window
+            resolution: Seconds covered by each bucket
+        """
+        self._resolution = resolution
+        self._buckets = array("I", bytes(4 * (window_seconds // resolution)))
+        self._last_bucket = 0
+        self.total = 0
+    
+    def _advance(self, now: float) -> int:
+        """Expire buckets that fell out of the window; return the current bucket."""
+        bucket = int(now // self._resolution)
+        elapsed = bucket - self._last_bucket
+        if elapsed > 0:
+            size = len(self._buckets)
+            if elapsed >= size:
+                self._buckets = array("I", bytes(4 * size))
+                self.total = 0
+            else:
+                for b in range(self._last_bucket + 1, bucket + 1):
+                    i = b % size
+                    self.total -= self._buckets[i]
+                    self._buckets[i] = 0
+            self._last_bucket = bucket
+        return bucket
+    
+    def add(self, now: float) -> None:
+        """Record one event at time `now`."""
+        bucket = self._advance(now)
+        self._buckets[bucket % len(self._buckets)] += 1
+        self.total += 1
+    
+    def count(self, now: float) -> int:
+        """Return the number of events inside the window ending at `now`."""
+        self._advance(now)
+        return self.total
+
+
 class RateLimiter:
     """
     Rate limiter for API calls.
@@ -42,23 +99,55 @@ class RateLimiter:
     async/await interface for easy integration.
     """
     
-    def __init__(self, config: RateLimitConfig):
+    def __init__(self, config: RateLimitConfig, time_fn: Callable[[], float] = time.monotonic):
         """
         Initialize the rate limiter.
         
         Args:
             config: Rate limiting configuration
+            time_fn: Monotonic clock in seconds (injectable for tests)
         """
         self.config = config
+        self._time_fn = time_fn
+        
+        # The config is frozen, so hot-path fields can be read once here
+        self._strategy = config.strategy
+        self._burst_limit = config.burst_limit
+        self._per_minute = config.requests_per_minute
+        self._per_hour = config.requests_per_hour
+        self._per_day = config.requests_per_day
         self.request_times: list = []
         self.last_request_time: float = 0
         self.current_burst: int = 0
-        self.last_burst_reset: float = time.time()
+        self.last_burst_reset: float = time_fn()
+        
+        # Token bucket state, refilled lazily on each check
+        self._refill_rate = config.requests_per_minute / 60.0
+        self._last_refill: float = self.last_burst_reset
+        if config.strategy == RateLimitStrategy.TOKEN_BUCKET:
+            # Start with 1 token for an immediate first request
+            self.current_burst = 1.0
         
-        # Track different time windows
-        self.minute_requests: list = []
-        self.hour_requests: list = []
-        self.day_requests: list = []
+        # Track different time windows with fixed-size bucket counters
+        # (per-second buckets for minute/hour, per-minute buckets for the day)
+        self.minute_requests = _SlidingCounter(60)
+        self.hour_requests = _SlidingCounter(3600)
+        self.day_requests = _SlidingCounter(86400, resolution=60)
+        
+        # Callers blocked on the limit, admitted in FIFO order by a single timer
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._release_handle: Optional[asyncio.TimerHandle] = None
+        
+        # Status fields that only depend on the configuration
+        self._static_status: Dict[str, Any] = {
+            "strategy": config.strategy.value,
+            "burst_limit": config.burst_limit,
+            "limits": {
+                "per_minute": config.requests_per_minute,
+                "per_hour": config.requests_per_hour,
+                "per_day": config.requests_per_day
+            }
+        }
     
     async def acquire(self, timeout: Optional[float] = None) -> bool:
         """
@@ -70,47 +159,99 @@ class RateLimiter:
         Returns:
             True if permission granted, False if timeout
         """
-        start_time = time.time()
-        
-        while True:
+        if not self._waiters:
             if self._can_make_request():
                 self._record_request()
                 return True
-            
-            # Check timeout
-            if timeout is not None and (time.time() - start_time) > timeout:
+            # The next token cannot arrive in time, so don't bother queueing
+            if timeout is not None and self._next_release_delay() > timeout:
                 return False
-            
-            # Wait before retrying
-            await asyncio.sleep(0.1)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._schedule_release()
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if waiter.cancelled():
+                # Timed out or cancelled: leave the queue, and stop the timer
+                # once nobody is left waiting for it
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not self._waiters:
+                    self._cancel_release()
+    
+    def _next_release_delay(self) -> float:
+        """Seconds until a blocked request may be admitted."""
+        if self._strategy == RateLimitStrategy.TOKEN_BUCKET:
+            if self._refill_rate <= 0:
+                return math.inf  # Tokens never refill
+            return max(0.0, (1.0 - self.current_burst) / self._refill_rate)
+        return 0.1
+    
+    def _schedule_release(self) -> None:
+        """Arm the release timer unless one is already pending."""
+        if self._release_handle is None:
+            delay = self._next_release_delay()
+            if delay == math.inf:
+                return  # Nothing will ever be released; waiters time out
+            self._release_handle = asyncio.get_running_loop().call_later(
+                delay, self._release_next
+            )
+    
+    def _cancel_release(self) -> None:
+        """Disarm the release timer."""
+        if self._release_handle is not None:
+            self._release_handle.cancel()
+            self._release_handle = None
+    
+    def _release_next(self) -> None:
+        """Admit queued callers in arrival order while the limits allow it."""
+        self._release_handle = None
+        waiters = self._waiters
+        while waiters:
+            if waiters[0].done():
+                # Timed out or cancelled while queued
+                waiters.popleft()
+                continue
+            if not self._can_make_request():
+                break
+            self._record_request()
+            waiters.popleft().set_result(None)
+        if waiters:
+            self._schedule_release()
     
     def _can_make_request(self) -> bool:
         """Check if a request can be made based on rate limits."""
-        current_time = time.time()
+        current_time = self._time_fn()
         
-        # Clean up old requests
-        self._cleanup_old_requests(current_time)
+        if self._strategy == RateLimitStrategy.TOKEN_BUCKET:
+            # Tokens are capped at burst_limit, so the burst check below does not apply
+            return self._check_token_bucket(current_time)
         
         # Reset burst counter if enough time has passed (for non-token-bucket strategies)
         # Use a longer reset interval to prevent premature resets
-        if (self.config.strategy != RateLimitStrategy.TOKEN_BUCKET and 
-            self.config.strategy != RateLimitStrategy.LEAKY_BUCKET and
+        if (self._strategy != RateLimitStrategy.TOKEN_BUCKET and 
+            self._strategy != RateLimitStrategy.LEAKY_BUCKET and
             current_time - self.last_burst_reset > 5.0):  # Reset burst every 5 seconds
             self.current_burst = 0
             self.last_burst_reset = current_time
         
         # Check burst limit
-        if self.current_burst >= self.config.burst_limit:
+        if self.current_burst >= self._burst_limit:
             return False
         
         # Check rate limits based on strategy
-        if self.config.strategy == RateLimitStrategy.FIXED_WINDOW:
+        if self._strategy == RateLimitStrategy.FIXED_WINDOW:
             return self._check_fixed_window(current_time)
-        elif self.config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+        elif self._strategy == RateLimitStrategy.SLIDING_WINDOW:
             return self._check_sliding_window(current_time)
-        elif self.config.strategy == RateLimitStrategy.TOKEN_BUCKET:
-            return self._check_token_bucket(current_time)
-        elif self.config.strategy == RateLimitStrategy.LEAKY_BUCKET:
+        elif self._strategy == RateLimitStrategy.LEAKY_BUCKET:
             return self._check_leaky_bucket(current_time)
         
         return True
@@ -118,66 +259,46 @@ class RateLimiter:
     def _check_fixed_window(self, current_time: float) -> bool:
         """Check fixed window rate limits."""
         # Check minute limit
-        minute_ago = current_time - 60
-        minute_count = len([t for t in self.minute_requests if t > minute_ago])
-        if minute_count >= self.config.requests_per_minute:
+        if self.minute_requests.count(current_time) >= self._per_minute:
             return False
         
         # Check hour limit
-        hour_ago = current_time - 3600
-        hour_count = len([t for t in self.hour_requests if t > hour_ago])
-        if hour_count >= self.config.requests_per_hour:
+        if self.hour_requests.count(current_time) >= self._per_hour:
             return False
         
         # Check day limit
-        day_ago = current_time - 86400
-        day_count = len([t for t in self.day_requests if t > day_ago])
-        if day_count >= self.config.requests_per_day:
+        if self.day_requests.count(current_time) >= self._per_day:
             return False
         
         return True
     
     def _check_sliding_window(self, current_time: float) -> bool:
         """Check sliding window rate limits."""
-        # Sliding window: count requests in the last window period
-        window_size = 60  # 1 minute window
-        
-        # Count requests in the sliding window
-        window_start = current_time - window_size
-        window_requests = [t for t in self.minute_requests if t > window_start]
-        
-        # Check if we're within the limit
-        if len(window_requests) >= self.config.requests_per_minute:
+        # Sliding window: count requests in the last minute
+        if self.minute_requests.count(current_time) >= self._per_minute:
             return False
         
         # Also check burst limit
-        if self.current_burst >= self.config.burst_limit:
+        if self.current_burst >= self._burst_limit:
             return False
         
         return True
     
     def _check_token_bucket(self, current_time: float) -> bool:
         """Check token bucket rate limits."""
-        tokens_per_second = self.config.requests_per_minute / 60.0
-        
-        # Handle initial state
-        if self.last_request_time == 0:
-            # Start with 1 token for immediate first request
-            self.current_burst = 1.0
-            return True
-        
-        time_since_last = current_time - self.last_request_time
-        
-        # Add tokens based on time passed
-        new_tokens = time_since_last * tokens_per_second
-        self.current_burst = min(self.config.burst_limit, self.current_burst + new_tokens)
+        # Add tokens for the time passed since the last refill
+        self.current_burst = min(
+            self._burst_limit,
+            self.current_burst + (current_time - self._last_refill) * self._refill_rate,
+        )
+        self._last_refill = current_time
         
         # Check if we have at least one token to consume
         return self.current_burst >= 1.0
     
     def _check_leaky_bucket(self, current_time: float) -> bool:
         """Check leaky bucket rate limits."""
-        leak_rate = self.config.requests_per_minute / 60.0
+        leak_rate = self._per_minute / 60.0
         
         # Handle initial state
         if self.last_request_time == 0:
@@ -190,26 +311,19 @@ class RateLimiter:
         leaked_tokens = time_since_last * leak_rate
         self.current_burst = max(0, self.current_burst - leaked_tokens)
         
-        return self.current_burst < self.config.burst_limit
-    
-    def _cleanup_old_requests(self, current_time: float) -> None:
-        """Clean up old request timestamps."""
-        # Keep only recent requests for memory efficiency
-        self.minute_requests = [t for t in self.minute_requests if t > current_time - 60]
-        self.hour_requests = [t for t in self.hour_requests if t > current_time - 3600]
-        self.day_requests = [t for t in self.day_requests if t > current_time - 86400]
+        return self.current_burst < self._burst_limit
     
     def _record_request(self) -> None:
         """Record a successful request."""
-        current_time = time.time()
+        current_time = self._time_fn()
         
         # Update burst counter based on strategy
-        if self.config.strategy == RateLimitStrategy.TOKEN_BUCKET:
+        if self._strategy == RateLimitStrategy.TOKEN_BUCKET:
             # Consume a token
             self.current_burst = max(0, self.current_burst - 1.0)
-        elif self.config.strategy == RateLimitStrategy.LEAKY_BUCKET:
+        elif self._strategy == RateLimitStrategy.LEAKY_BUCKET:
             # Add to bucket
-            self.current_burst = min(self.config.burst_limit, self.current_burst + 1.0)
+            self.current_burst = min(self._burst_limit, self.current_burst + 1.0)
         else:
             # Fixed/Sliding window - use burst counter
             if current_time - self.last_burst_reset > 1.0:  # Reset burst every second
@@ -221,27 +335,24 @@ class RateLimiter:
         self.last_request_time = current_time
         
         # Record in different time windows
-        self.minute_requests.append(current_time)
-        self.hour_requests.append(current_time)
-        self.day_requests.append(current_time)
+        self.minute_requests.add(current_time)
+        self.hour_requests.add(current_time)
+        self.day_requests.add(current_time)
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get current rate limiter status."""
-        current_time = time.time()
+    def snapshot_counts(self) -> Dict[str, Any]:
+        """Get the burst level and request counts for each time window."""
+        current_time = self._time_fn()
         
         return {
-            "strategy": self.config.strategy.value,
             "current_burst": self.current_burst,
-            "burst_limit": self.config.burst_limit,
-            "requests_last_minute": len([t for t in self.minute_requests if t > current_time - 60]),
-            "requests_last_hour": len([t for t in self.hour_requests if t > current_time - 3600]),
-            "requests_last_day": len([t for t in self.day_requests if t > current_time - 86400]),
-            "limits": {
-                "per_minute": self.config.requests_per_minute,
-                "per_hour": self.config.requests_per_hour,
-                "per_day": self.config.requests_per_day
-            }
+            "requests_last_minute": self.minute_requests.count(current_time),
+            "requests_last_hour": self.hour_requests.count(current_time),
+            "requests_last_day": self.day_requests.count(current_time),
         }
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get current rate limiter status."""
+        return {**self._static_status, **self.snapshot_counts()}
 
 
 class RateLimitedModel:
@@ -270,21 +381,21 @@ class RateLimitedModel:
     async def generate_response(self, *args, **kwargs):
         """Generate response with rate limiting."""
         if not await self.rate_limiter.acquire(timeout=1.0):
-            raise Exception("Rate limit exceeded")
+            raise RateLimitExceeded("Rate limit exceeded")
         
         return await self.model.generate_response(*args, **kwargs)
     
     async def generate_structured_response(self, *args, **kwargs):
         """Generate structured response with rate limiting."""
         if not await self.rate_limiter.acquire(timeout=1.0):
-            raise Exception("Rate limit exceeded")
+            raise RateLimitExceeded("Rate limit exceeded")
         
         return await self.model.generate_structured_response(*args, **kwargs)
     
     async def get_embeddings(self, *args, **kwargs):
         """Get embeddings with rate limiting."""
         if not await self.rate_limiter.acquire(timeout=1.0):
-            raise Exception("Rate limit exceeded")
+            raise RateLimitExceeded("Rate limit exceeded")
         
         return await self.model.get_embeddings(*args, **kwargs)
     
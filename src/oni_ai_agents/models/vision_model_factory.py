@@ -5,8 +5,20 @@ This factory creates and configures different AI vision models
 for image analysis in the ONI AI system.
 """
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+def _freeze(value: Any) -> Hashable:
+    """Recursively convert a config value into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
 
 
 class BaseVisionModel(ABC):
@@ -69,10 +81,15 @@ class VisionModelFactory:
         "local": LocalVisionModel,
     }
     
+    # Instances are reused for identical (provider, config) pairs; oldest evicted first
+    _instances: Dict[Tuple[str, Hashable], BaseVisionModel] = {}
+    _max_instances = 64
+    
     @classmethod
     def create(cls, provider: str, config: Dict[str, Any]) -> BaseVisionModel:
         """
-        Create a vision model instance.
+        Create a vision model instance, reusing a previous one built for an
+        equal configuration.
         
         Args:
             provider: Model provider (openai, anthropic, local)
@@ -84,18 +101,35 @@ class VisionModelFactory:
         Raises:
             ValueError: If provider is not supported
         """
-        if provider not in cls._providers:
+        # Single registry lookup; unknown (or unhashable) providers fall through
+        model_class = cls._providers.get(provider) if isinstance(provider, str) else None
+        if model_class is None:
             raise ValueError(f"Unsupported vision model provider: {provider}")
-        
-        model_class = cls._providers[provider]
-        return model_class(config)
+        try:
+            key = (provider, _freeze(config))
+            model = cls._instances.get(key)
+        except TypeError:
+            # Config holds unhashable values; build uncached
+            return model_class(config)
+        if model is None:
+            if len(cls._instances) >= cls._max_instances:
+                del cls._instances[next(iter(cls._instances))]
+            # Private copy so later edits to the caller's dict cannot drift
+            # the shared instance away from its cache key
+            model = cls._instances[key] = model_class(copy.deepcopy(config))
+        return model
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached model instances."""
+        cls._instances.clear()
     
     @classmethod
     def get_supported_providers(cls) -> List[str]:
         """Get list of supported providers."""
-        return list(cls._providers.keys())
+        return list(cls._providers)
     
     @classmethod
     def is_provider_supported(cls, provider: str) -> bool:
         """Check if a provider is supported."""
-        return provider in cls._providers 
\ No newline at end of file
+        return isinstance(provider, str) and provider in cls._providers
@@ -7,10 +7,12 @@ based on analysis of RoboPhred's JavaScript parser.
 
 from .binary_reader import BinaryReader
 from .data_structures import GameObject, SaveGame, SaveGameHeader
+from .parse_cache import parse_save_file_cached
 from .save_parser import OniSaveParser
 
 __all__ = [
     "OniSaveParser",
+    "parse_save_file_cached",
     "SaveGame", 
     "SaveGameHeader",
     "GameObject",
@@ -5,10 +5,22 @@ Low-level binary operations for reading ONI save file data.
 Based on RoboPhred's ArrayDataReader implementation.
 """
 
+import mmap
 import struct
 import zlib
-from io import BytesIO
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Union
+
+# Precompiled little-endian layouts, unpacked in place from the view
+_INT8 = struct.Struct('<b')
+_UINT8 = struct.Struct('<B')
+_INT16 = struct.Struct('<h')
+_UINT16 = struct.Struct('<H')
+_INT32 = struct.Struct('<i')
+_UINT32 = struct.Struct('<I')
+_INT64 = struct.Struct('<q')
+_UINT64 = struct.Struct('<Q')
+_FLOAT32 = struct.Struct('<f')
+_FLOAT64 = struct.Struct('<d')
 
 
 class BinaryReader:
@@ -19,63 +31,84 @@ class BinaryReader:
     matching the structure used in ONI save files.
     """
     
-    def __init__(self, data: bytes):
+    def __init__(self, data: Union[bytes, bytearray, memoryview, mmap.mmap]):
         """
         Initialize with binary data.
         
         Args:
-            data: Raw binary data from save file
+            data: Raw binary data from save file; any bytes-like object
+                (including a read-only mmap) is read in place without copying
         """
-        self.stream = BytesIO(data)
+        self._view = memoryview(data)
+        self._size = len(self._view)
         self.position = 0
     
     def read_bytes(self, count: int) -> bytes:
         """Read a specific number of bytes."""
-        data = self.stream.read(count)
-        if len(data) != count:
-            raise EOFError(f"Expected {count} bytes, got {len(data)}")
-        self.position += count
+        end = self.position + count
+        if end > self._size:
+            raise EOFError(f"Expected {count} bytes, got {max(0, self._size - self.position)}")
+        data = self._view[self.position:end].tobytes()
+        self.position = end
         return data
     
+    def read_view(self, count: int) -> memoryview:
+        """Read a specific number of bytes as a zero-copy view of the buffer."""
+        end = self.position + count
+        if end > self._size:
+            raise EOFError(f"Expected {count} bytes, got {max(0, self._size - self.position)}")
+        view = self._view[self.position:end]
+        self.position = end
+        return view
+    
+    def _unpack(self, layout: struct.Struct) -> Any:
+        """Unpack one value in place and advance past it."""
+        pos = self.position
+        end = pos + layout.size
+        if end > self._size:
+            raise EOFError(f"Expected {layout.size} bytes, got {max(0, self._size - pos)}")
+        self.position = end
+        return layout.unpack_from(self._view, pos)[0]
+    
     def read_int8(self) -> int:
         """Read a signed 8-bit integer."""
-        return struct.unpack('<b', self.read_bytes(1))[0]
+        return self._unpack(_INT8)
     
     def read_uint8(self) -> int:
         """Read an unsigned 8-bit integer."""
-        return struct.unpack('<B', self.read_bytes(1))[0]
+        return self._unpack(_UINT8)
     
     def read_int16(self) -> int:
         """Read a signed 16-bit integer (little-endian)."""
-        return struct.unpack('<h', self.read_bytes(2))[0]
+        return self._unpack(_INT16)
     
     def read_uint16(self) -> int:
         """Read an unsigned 16-bit integer (little-endian)."""
-        return struct.unpack('<H', self.read_bytes(2))[0]
+        return self._unpack(_UINT16)
     
     def read_int32(self) -> int:
         """Read a signed 32-bit integer (little-endian)."""
-        return struct.unpack('<i', self.read_bytes(4))[0]
+        return self._unpack(_INT32)
     
     def read_uint32(self) -> int:
         """Read an unsigned 32-bit integer (little-endian)."""
-        return struct.unpack('<I', self.read_bytes(4))[0]
+        return self._unpack(_UINT32)
     
     def read_int64(self) -> int:
         """Read a signed 64-bit integer (little-endian)."""
-        return struct.unpack('<q', self.read_bytes(8))[0]
+        return self._unpack(_INT64)
     
     def read_uint64(self) -> int:
         """Read an unsigned 64-bit integer (little-endian)."""
-        return struct.unpack('<Q', self.read_bytes(8))[0]
+        return self._unpack(_UINT64)
     
     def read_float32(self) -> float:
         """Read a 32-bit float (little-endian)."""
-        return struct.unpack('<f', self.read_bytes(4))[0]
+        return self._unpack(_FLOAT32)
     
     def read_float64(self) -> float:
         """Read a 64-bit float (little-endian)."""
-        return struct.unpack('<d', self.read_bytes(8))[0]
+        return self._unpack(_FLOAT64)
     
     def read_bool(self) -> bool:
         """Read a boolean value (1 byte)."""
@@ -95,8 +128,13 @@ class BinaryReader:
         if length == 0:
             return ""
         
-        string_bytes = self.read_bytes(length)
-        return string_bytes.decode('utf-8')
+        end = self.position + length
+        if end > self._size:
+            raise EOFError(f"Expected {length} bytes, got {max(0, self._size - self.position)}")
+        start = self.position
+        self.position = end
+        # Decode straight from the view without an intermediate bytes copy
+        return str(self._view[start:end], 'utf-8')
     
     def read_array(self, element_reader: Callable[[], Any]) -> List[Any]:
         """
@@ -160,7 +198,8 @@ class BinaryReader:
             New BinaryReader with decompressed data
         """
         if compressed_size is None:
-            compressed_data = self.stream.read()
+            compressed_data = self._view[self.position:]
+            self.position = self._size
         else:
             compressed_data = self.read_bytes(compressed_size)
         
@@ -172,25 +211,19 @@ class BinaryReader:
     
     def skip_bytes(self, count: int):
         """Skip a number of bytes."""
-        self.stream.seek(count, 1)  # Seek relative to current position
         self.position += count
     
     def get_position(self) -> int:
         """Get current position in stream."""
-        return self.stream.tell()
+        return self.position
     
     def seek(self, position: int):
         """Seek to absolute position."""
-        self.stream.seek(position)
         self.position = position
     
     def remaining_bytes(self) -> int:
         """Get number of bytes remaining in stream."""
-        current = self.stream.tell()
-        self.stream.seek(0, 2)  # Seek to end
-        end = self.stream.tell()
-        self.stream.seek(current)  # Seek back
-        return end - current
+        return self._size - self.position
     
     def is_at_end(self) -> bool:
         """Check if at end of stream."""
@@ -8,6 +8,20 @@ from __future__ import annotations
 
 from typing import Generator, Optional, Tuple
 
+try:  # Optional: zlib-ng is a faster drop-in for the stdlib zlib module
+    from zlib_ng import zlib_ng as _zlib
+except ImportError:
+    import zlib as _zlib
+
+# Stream decompression and checksum used for every block; both backends accept
+# memoryviews and ignore trailing data after the end of a stream
+zlib_decompress = _zlib.decompress
+zlib_decompressobj = _zlib.decompressobj
+crc32 = _zlib.crc32
+
+# zlib headers (CMF 0x78) for default, best and fastest compression levels
+_ZLIB_SIGNATURES = (b"\x78\x9c", b"\x78\xda", b"\x78\x01")
+
 
 class CompressedBlocksScanner:
     """Scan ONI save bytes for compressed blocks and provide decompression helpers."""
@@ -37,53 +51,39 @@ class CompressedBlocksScanner:
             return 0, is_compressed
         return p_end, is_compressed
 
+    def iter_candidate_offsets(self, data: bytes, start: int) -> Generator[int, None, None]:
+        """Yield absolute offsets of zlib stream signatures at or after `start`.
+
+        Offsets are grouped by signature, in file order within each group. The
+        signatures differ in their second byte, so no offset is yielded twice.
+        """
+        for sig in _ZLIB_SIGNATURES:
+            pos = data.find(sig, start)
+            while pos != -1:
+                yield pos
+                pos = data.find(sig, pos + 1)
+
     def decompress_body_block(self, data: bytes) -> Optional[bytes]:
         """Find and decompress the main save body block (zlib) by scanning after header JSON."""
-        import zlib
-
         start_after_header, _ = self.parse_header_raw(data)
-        search = data[start_after_header:]
-        candidates = []
-        for sig in (b"\x78\x9c", b"\x78\xda", b"\x78\x01"):
-            idx = 0
-            while True:
-                pos = search.find(sig, idx)
-                if pos == -1:
-                    break
-                candidates.append(start_after_header + pos)
-                idx = pos + 1
-        for pos in sorted(set(candidates)):
-            try:
-                decompressed = zlib.decompress(data[pos:])
-                if b"KSAV" in decompressed:
-                    return decompressed
-            except Exception:
-                continue
+        # Decompress from zero-copy views instead of slicing the file tail each time
+        with memoryview(data) as mv:
+            for pos in sorted(self.iter_candidate_offsets(data, start_after_header)):
+                try:
+                    decompressed = zlib_decompress(mv[pos:])
+                    if b"KSAV" in decompressed:
+                        return decompressed
+                except Exception:
+                    continue
         return None
 
     def iter_decompressed_blocks(self, data: bytes) -> Generator[bytes, None, None]:
         """Yield all successfully decompressed zlib blocks after header JSON."""
-        import zlib
-
         start_after_header, _ = self.parse_header_raw(data)
-        search = data[start_after_header:]
-        seen = set()
-        for sig in (b"\x78\x9c", b"\x78\xda", b"\x78\x01"):
-            idx = 0
-            while True:
-                pos = search.find(sig, idx)
-                if pos == -1:
-                    break
-                abs_pos = start_after_header + pos
-                if abs_pos in seen:
-                    idx = pos + 1
-                    continue
-                seen.add(abs_pos)
+        with memoryview(data) as mv:
+            for pos in self.iter_candidate_offsets(data, start_after_header):
                 try:
-                    decompressed = zlib.decompress(data[abs_pos:])
-                    yield decompressed
+                    decompressed = zlib_decompress(mv[pos:])
                 except Exception:
-                    pass
-                idx = pos + 1
-
-
+                    continue
+                yield decompressed
@@ -6,6 +6,7 @@ These represent the structured data found in ONI save files.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 
@@ -200,8 +201,13 @@ class SaveGame:
             counts[group.name] = len(group.game_objects)
         return counts
 
-    def get_summary(self) -> Dict[str, Any]:
-        """Get a summary of save file contents."""
+    @cached_property
+    def summary(self) -> Dict[str, Any]:
+        """Summary of save file contents, computed once on first access.
+
+        The parser fills the save in before returning it, so the summary is
+        stable for a parsed save; treat the returned dict as read-only.
+        """
         return {
             "version": str(self.version),
             "cycles": self.header.num_cycles,
@@ -213,6 +219,10 @@ class SaveGame:
             "sim_data_size": len(self.sim_data),
         }
 
+    def get_summary(self) -> Dict[str, Any]:
+        """Get a summary of save file contents."""
+        return self.summary
+
 
 # Helper classes for specific game object types
 
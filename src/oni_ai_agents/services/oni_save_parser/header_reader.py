@@ -6,8 +6,16 @@ Parses the JSON header region and extracts key metadata and version info.
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
+try:  # Optional: orjson decodes straight from the buffer, skipping the str copy
+    from orjson import loads as _loads_json
+except ImportError:
+
+    def _loads_json(data: memoryview) -> Any:
+        return json.loads(bytes(data))
+
 from .binary_reader import BinaryReader
 from .data_structures import SaveGameHeader
 
@@ -16,8 +24,6 @@ class SaveHeaderReader:
     """Parse the ONI save header JSON and normalize fields."""
 
     def parse_header(self, reader: BinaryReader, result) -> SaveGameHeader:
-        import json
-
         header = SaveGameHeader()
         build_version = reader.read_uint32()
         header_size = reader.read_uint32()
@@ -27,9 +33,10 @@ class SaveHeaderReader:
         if header_version >= 1:
             is_compressed = bool(reader.read_uint32())
 
-        info_bytes = reader.read_bytes(header_size)
-        info_str = info_bytes.decode("utf-8")
-        game_info = json.loads(info_str)
+        # Decode the JSON from a view of the save buffer (released before the
+        # file is unmapped); with orjson no decoded str copy is built
+        with reader.read_view(header_size) as info_view:
+            game_info = _loads_json(info_view)
 
         header.game_info = game_info
 
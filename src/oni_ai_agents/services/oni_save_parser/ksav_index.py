@@ -6,15 +6,23 @@ Count groups and instances from a decompressed KSAV body and provide summaries.
 
 from __future__ import annotations
 
+import struct
 from typing import Dict
 
+# Smallest possible group entry: int32 name length, int32 count, int32 payload length
+_MIN_GROUP_BYTES = 12
+
+# Precompiled layouts: 'KSAV' tag + major + minor + group_count, then per group
+# an int32 name length and an (instance_count, payload_length) pair
+_KSAV_HEADER = struct.Struct("<4siii")
+_INT32 = struct.Struct("<i")
+_GROUP_COUNTS = struct.Struct("<ii")
+
 
 class KSAVGroupCounter:
     """Count KSAV groups and instances from a decompressed body."""
 
     def extract_object_group_counts(self, body: bytes) -> Dict[str, int]:
-        import struct
-
         counts: Dict[str, int] = {}
         if not body:
             return counts
@@ -22,81 +30,73 @@ class KSAVGroupCounter:
         ksav_pos = body.find(b"KSAV")
         if ksav_pos == -1:
             return counts
-        p = ksav_pos + 4
-        if p + 12 > len(body):
+        p = ksav_pos + _KSAV_HEADER.size
+        if p > len(body):
             return counts
         try:
-            struct.unpack_from("<i", mv, p)[0]
-            p += 4
-            struct.unpack_from("<i", mv, p)[0]
-            p += 4
-            group_count = struct.unpack_from("<i", mv, p)[0]
-            p += 4
+            _, _, _, group_count = _KSAV_HEADER.unpack_from(mv, ksav_pos)
         except Exception:
             return counts
         if group_count < 0:
             return counts
-        for _ in range(group_count):
-            if p + 4 > len(body):
+        # A bogus count cannot yield more groups than the bytes left can hold
+        end = len(body)
+        read_int32 = _INT32.unpack_from
+        read_counts = _GROUP_COUNTS.unpack_from
+        for _ in range(min(group_count, (end - p) // _MIN_GROUP_BYTES)):
+            if p + 4 > end:
                 break
-            name_len = struct.unpack_from("<i", mv, p)[0]
+            name_len = read_int32(mv, p)[0]
             p += 4
-            if name_len < 0 or p + name_len > len(body):
+            if name_len < 0 or p + name_len > end:
                 break
             try:
-                name = bytes(mv[p : p + name_len]).decode("utf-8", errors="ignore")
+                # Decode straight from the view; no intermediate bytes copy
+                name = str(mv[p : p + name_len], "utf-8", "ignore")
             except Exception:
                 name = ""
             p += name_len
-            if p + 8 > len(body):
+            if p + 8 > end:
                 break
-            instance_count = struct.unpack_from("<i", mv, p)[0]
-            p += 4
-            payload_len = struct.unpack_from("<i", mv, p)[0]
-            p += 4
+            instance_count, payload_len = read_counts(mv, p)
+            p += 8
             counts[name] = int(instance_count)
             if payload_len < 0:
                 break
             p += payload_len
-            if p > len(body):
+            if p > end:
                 break
         return counts
 
     def summarize(self, body: bytes) -> Dict[str, int]:
-        import struct
-
         summary = {"group_count": 0, "total_instances": 0}
         if not body:
             return summary
         mv = memoryview(body)
         pos = body.find(b"KSAV")
-        if pos == -1 or pos + 12 > len(body):
+        if pos == -1 or pos + _KSAV_HEADER.size > len(body):
             return summary
-        p = pos + 4
-        struct.unpack_from("<i", mv, p)[0]
-        p += 4
-        struct.unpack_from("<i", mv, p)[0]
-        p += 4
-        group_count = struct.unpack_from("<i", mv, p)[0]
-        p += 4
+        _, _, _, group_count = _KSAV_HEADER.unpack_from(mv, pos)
+        p = pos + _KSAV_HEADER.size
         total_instances = 0
-        for _ in range(max(0, group_count)):
-            if p + 4 > len(body):
+        end = len(body)
+        read_int32 = _INT32.unpack_from
+        read_counts = _GROUP_COUNTS.unpack_from
+        for _ in range(max(0, min(group_count, (end - p) // _MIN_GROUP_BYTES))):
+            if p + 4 > end:
                 break
-            name_len = struct.unpack_from("<i", mv, p)[0]
+            name_len = read_int32(mv, p)[0]
             p += 4
-            if name_len < 0 or p + name_len > len(body):
+            if name_len < 0 or p + name_len > end:
                 break
             p += name_len
-            if p + 8 > len(body):
+            if p + 8 > end:
                 break
-            instance_count = struct.unpack_from("<i", mv, p)[0]
-            p += 4
-            data_length = struct.unpack_from("<i", mv, p)[0]
-            p += 4
+            instance_count, data_length = read_counts(mv, p)
+            p += 8
             total_instances += int(instance_count)
             p = p + max(0, data_length)
-            if p > len(body):
+            if p > end:
                 break
         summary["group_count"] = int(group_count)
         summary["total_instances"] = int(total_instances)
@@ -6,12 +6,66 @@ Computes compressed block diagnostics and KSAV summaries.
 
 from __future__ import annotations
 
-from typing import Optional
+import atexit
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
-from .compressed_blocks import CompressedBlocksScanner
+from .compressed_blocks import CompressedBlocksScanner, crc32, zlib_decompressobj
 from .data_structures import SaveBlockInfo, SaveGameMetadata
 from .ksav_index import KSAVGroupCounter
 
+# Input/output window per decompress call; bounds each worker's memory
+# regardless of how far the candidate stream runs into the file
+_DECOMPRESS_CHUNK = 1 << 20
+
+# Shared across builders; zlib releases the GIL, so threads decompress in parallel
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the shared decompression pool once, shutting it down at exit."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, 8), thread_name_prefix="oni-metadata"
+            )
+            atexit.register(_executor.shutdown, wait=False)
+        return _executor
+
+
+def _decompress_one(view: memoryview) -> Optional[Tuple[int, str]]:
+    """Return (decompressed_size, crc32_hex) for a zlib stream, or None if invalid.
+
+    The stream is inflated in bounded chunks with a running CRC, so neither
+    the remaining input nor the full output is ever copied at once.
+    """
+    decompressor = zlib_decompressobj()
+    size = crc = 0
+    pos = 0
+    full = False
+    try:
+        while not decompressor.eof:
+            if decompressor.unconsumed_tail:
+                chunk = decompressor.unconsumed_tail
+            elif pos < len(view):
+                chunk = view[pos : pos + _DECOMPRESS_CHUNK]
+                pos += len(chunk)
+            elif full:
+                chunk = b""  # Drain output still buffered inside zlib
+            else:
+                return None  # Stream truncated before its end marker
+            out = decompressor.decompress(chunk, _DECOMPRESS_CHUNK)
+            full = len(out) == _DECOMPRESS_CHUNK
+            size += len(out)
+            crc = crc32(out, crc)
+    except Exception:
+        return None
+    return size, format(crc & 0xFFFFFFFF, "08x")
+
 
 class MetadataBuilder:
     """Build `SaveGameMetadata` using scanners and counters."""
@@ -21,9 +75,6 @@ class MetadataBuilder:
         self._ksav = KSAVGroupCounter()
 
     def build(self, file_bytes: bytes, cached_body: Optional[bytes]) -> SaveGameMetadata:
-        import binascii
-        import zlib
-
         metadata = SaveGameMetadata()
         # Maintain default keys expected by current consumers
         metadata.ksav_summary = {"group_count": 0, "total_instances": 0}
@@ -31,41 +82,30 @@ class MetadataBuilder:
             return metadata
 
         start_after_header, _ = self._blocks.parse_header_raw(file_bytes)
-        search = file_bytes[start_after_header:]
-        seen = set()
-        for sig in (b"\x78\x9c", b"\x78\xda", b"\x78\x01"):
-            idx = 0
-            while True:
-                pos = search.find(sig, idx)
-                if pos == -1:
-                    break
-                abs_pos = start_after_header + pos
-                if abs_pos in seen:
-                    idx = pos + 1
+        offsets = list(self._blocks.iter_candidate_offsets(file_bytes, start_after_header))
+        with memoryview(file_bytes) as mv:
+            for abs_pos, stats in zip(offsets, self._decompress_candidates(mv, offsets)):
+                if stats is None:
                     continue
-                seen.add(abs_pos)
-                header_preview = file_bytes[abs_pos : abs_pos + 10].hex()
-                try:
-                    decompressed = zlib.decompress(file_bytes[abs_pos:])
-                    crc_hex = format(binascii.crc32(decompressed) & 0xFFFFFFFF, "08x")
-                    comp_size = len(file_bytes) - abs_pos
-                    decomp_size = len(decompressed)
-                    metadata.blocks.append(
-                        SaveBlockInfo(
-                            offset=abs_pos,
-                            header=header_preview,
-                            compressed_size=comp_size,
-                            decompressed_size=decomp_size,
-                            crc32=crc_hex,
-                        )
+                decomp_size, crc_hex = stats
+                metadata.blocks.append(
+                    SaveBlockInfo(
+                        offset=abs_pos,
+                        header=mv[abs_pos : abs_pos + 10].hex(),
+                        compressed_size=len(file_bytes) - abs_pos,
+                        decompressed_size=decomp_size,
+                        crc32=crc_hex,
                     )
-                except Exception:
-                    pass
-                idx = pos + 1
+                )
 
         body = cached_body or self._blocks.decompress_body_block(file_bytes) or b""
         if body:
             metadata.ksav_summary = self._ksav.summarize(body)
         return metadata
 
-
+    @staticmethod
+    def _decompress_candidates(mv: memoryview, offsets: list) -> list:
+        """Decompress each candidate offset, in order, fanning out when worthwhile."""
+        if len(offsets) < 2 or (os.cpu_count() or 1) < 2:
+            return [_decompress_one(mv[pos:]) for pos in offsets]
+        return list(_get_executor().map(_decompress_one, (mv[pos:] for pos in offsets)))
@@ -0,0 +1,97 @@
+"""
+On-disk cache of parse results.
+
+Re-parsing an unchanged save repeats all I/O, decompression and KSAV walking.
+Each save path gets a single cache file holding a stamp of the save's
+(mtime, size), the newest parser source mtime and the cache schema version,
+followed by the pickled result. Editing either the save or the parser makes
+the stamp stale, and the next parse overwrites the entry in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from .data_structures import ParseResult
+from .save_parser import OniSaveParser
+
+# Bump when ParseResult/SaveGame change shape in a way old pickles can't satisfy
+SCHEMA_VERSION = 3
+
+_PARSER_DIR = Path(__file__).resolve().parent
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_name(path: Path) -> str:
+    """Name the cache file after the resolved save path only."""
+    return hashlib.blake2b(str(path.resolve()).encode(), digest_size=16).hexdigest()
+
+
+def _cache_stamp(path: Path) -> Tuple[int, int, int, int]:
+    """Identify the save contents, parser sources and cache schema."""
+    st = path.stat()
+    parser_mtime = max(p.stat().st_mtime_ns for p in _PARSER_DIR.glob("*.py"))
+    return (st.st_mtime_ns, st.st_size, parser_mtime, SCHEMA_VERSION)
+
+
+def parse_save_file_cached(
+    file_path: Union[str, Path],
+    cache_dir: Union[str, Path],
+    parser: Optional[OniSaveParser] = None,
+) -> ParseResult:
+    """
+    Parse a save file, reusing a pickled result when the inputs are unchanged.
+
+    Args:
+        file_path: Path to the .sav file
+        cache_dir: Directory holding cached results (created on demand)
+        parser: Parser to use on a cache miss (a new one by default)
+
+    Returns:
+        ParseResult, either loaded from the cache or freshly parsed.
+        Failed parses are returned but never cached.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        return (parser or OniSaveParser()).parse_save_file(path)
+
+    cache_dir = Path(cache_dir)
+    cache_file = cache_dir / f"{_cache_name(path)}.pkl"
+    stamp = _cache_stamp(path)
+    try:
+        with open(cache_file, "rb") as f:
+            # The stamp is pickled ahead of the result so stale entries are
+            # rejected without unpickling the whole ParseResult
+            if pickle.load(f) == stamp:
+                return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable parse cache {cache_file}: {e}")
+
+    result = (parser or OniSaveParser()).parse_save_file(path)
+    if not result.success:
+        return result
+
+    # Write then rename so concurrent readers never see a partial pickle
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except Exception as e:
+        logger.warning(f"Could not write parse cache {cache_file}: {e}")
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+    return result
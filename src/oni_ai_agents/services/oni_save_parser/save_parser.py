@@ -6,6 +6,8 @@ Based on analysis of RoboPhred's JavaScript implementation.
 """
 
 import logging
+import mmap
+import os
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -15,7 +17,6 @@ from .compressed_blocks import CompressedBlocksScanner
 from .data_structures import (
     GameObjectGroups,
     ParseResult,
-    SaveBlockInfo,
     SaveGame,
     SaveGameData,
     SaveGameHeader,
@@ -63,6 +64,13 @@ class OniSaveParser:
         self._decoder = DuplicantDecoder()
         self._metadata_builder = MetadataBuilder()
         self._header_reader = SaveHeaderReader()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear per-parse caches so one instance can parse several files."""
+        self._last_file_bytes: Any = b""
+        self._cached_sim_body: Optional[bytes] = None
+        self.last_game_info: Dict[str, Any] = {}
 
     # -------------------- Minion structured helpers --------------------
     def _parse_minion_identity(
@@ -363,17 +371,19 @@ class OniSaveParser:
         """
         start_time = time.time()
         result = ParseResult()
+        file_data: Any = b""
 
         try:
             if not file_path.exists():
                 result.error_message = f"Save file not found: {file_path}"
                 return result
 
-            self.logger.info(f"Parsing ONI save file: {file_path}")
+            self.logger.info("Parsing ONI save file: %s", file_path)
+            # Never reuse the decompressed body or header of a previous file
+            self.reset()
 
-            # Read file data
-            with open(file_path, "rb") as f:
-                file_data = f.read()
+            # Map file data read-only instead of copying it into memory
+            file_data = self._map_save_file(file_path)
 
             # Preserve raw file bytes for downstream parsing helpers
             self._last_file_bytes = file_data
@@ -508,28 +518,47 @@ class OniSaveParser:
                 self.logger.info(
                     f"Successfully parsed save file in {result.parse_time_seconds:.2f}s"
                 )
-                self.logger.info(f"Save version: {save_game.version}")
-                self.logger.info(f"Cycles: {save_game.header.num_cycles}")
-                self.logger.info(f"Duplicants: {save_game.header.num_duplicants}")
-                # Derive quick object group counts from decompressed body (best-effort)
-                try:
-                    body = getattr(self, "_cached_sim_body", None)
-                    if body is None:
-                        fb: bytes = getattr(self, "_last_file_bytes", b"")
-                        if fb:
-                            body = self._decompress_body_block(fb)
-                    counts = self._extract_object_group_counts_from_body(body or b"")
-                    if counts:
-                        result.entities.setdefault("object_group_counts", counts)
-                except Exception:
-                    pass
+                self.logger.info("Save version: %s", save_game.version)
+                self.logger.info("Cycles: %s", save_game.header.num_cycles)
+                self.logger.info("Duplicants: %s", save_game.header.num_duplicants)
+                # Derive quick object group counts from decompressed body (best-effort),
+                # unless the world grid summary above already walked the KSAV groups
+                if "object_group_counts" not in result.entities:
+                    try:
+                        body = getattr(self, "_cached_sim_body", None)
+                        if body is None:
+                            fb: bytes = getattr(self, "_last_file_bytes", b"")
+                            if fb:
+                                body = self._decompress_body_block(fb)
+                        counts = self._extract_object_group_counts_from_body(body or b"")
+                        if counts:
+                            result.entities["object_group_counts"] = counts
+                    except Exception:
+                        pass
 
         except Exception as e:
             self.logger.error(f"Error parsing save file: {e}")
             result.error_message = str(e)
+        finally:
+            # Drop the mapping; the decompressed body stays cached for helpers
+            self._last_file_bytes = b""
+            if isinstance(file_data, mmap.mmap):
+                try:
+                    file_data.close()
+                except BufferError:
+                    # A view is still alive (e.g. held by a traceback); GC closes it
+                    pass
 
         return result
 
+    @staticmethod
+    def _map_save_file(file_path: Path) -> Any:
+        """Return a read-only mmap of the save file (empty bytes for empty files)."""
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
     def extract_minion_positions(self, file_path: Path) -> List[Dict[str, float]]:
         """Back-compat: return only positions. Prefer extract_minion_details."""
         try:
@@ -1464,57 +1493,41 @@ class OniSaveParser:
 
         if not body:
             return None
-        mv = memoryview(body)
-        i = 0
         key_bytes = key_name.encode("utf-8")
+        if not 0 < len(key_bytes) <= 256:
+            return None
+        mv = memoryview(body)
         n = len(body)
-        while i + 4 < n:
-            try:
-                # Attempt to read a Klei string at offset i
-                # Read length
-                sl = struct.unpack_from("<i", mv, i)[0]
-                if sl <= 0 or sl > 256:
-                    i += 1
-                    continue
-                if i + 4 + sl > n:
-                    i += 1
-                    continue
-                s = bytes(mv[i + 4 : i + 4 + sl])
-                # Move past string
-                j = i + 4 + sl
-                # Must match desired key
-                if s != key_bytes:
-                    i += 1
-                    continue
-                # Next should be kv_len
-                if j + 4 > n:
-                    return None
-                kv_len = struct.unpack_from("<i", mv, j)[0]
-                j += 4
-                if kv_len < 4 or j + kv_len > n:
-                    # Not a plausible kv block
-                    i += 1
-                    continue
-                # Try read int32 at payload start
-                try:
-                    v = struct.unpack_from("<i", mv, j)[0]
-                    if min_val <= v <= max_val:
-                        return int(v)
-                except Exception:
-                    pass
-                # Also try little-endian 32-bit float cast to int if plausible
-                try:
-                    fv = struct.unpack_from("<f", mv, j)[0]
-                    if 0.0 <= fv <= float(max_val):
-                        vi = int(round(fv))
-                        if min_val <= vi <= max_val:
-                            return vi
-                except Exception:
-                    pass
-                i = j + kv_len
-            except Exception:
+        # A matching Klei string is its int32 length followed by the key bytes,
+        # so locate candidates with bytes.find rather than probing every offset
+        needle = struct.pack("<i", len(key_bytes)) + key_bytes
+        i = 0
+        while True:
+            i = body.find(needle, i)
+            if i == -1:
+                return None
+            # Move past string
+            j = i + len(needle)
+            # Next should be kv_len
+            if j + 4 > n:
+                return None
+            kv_len = struct.unpack_from("<i", mv, j)[0]
+            j += 4
+            if kv_len < 4 or j + kv_len > n:
+                # Not a plausible kv block
                 i += 1
-        return None
+                continue
+            # Try read int32 at payload start
+            v = struct.unpack_from("<i", mv, j)[0]
+            if min_val <= v <= max_val:
+                return int(v)
+            # Also try little-endian 32-bit float cast to int if plausible
+            fv = struct.unpack_from("<f", mv, j)[0]
+            if 0.0 <= fv <= float(max_val):
+                vi = int(round(fv))
+                if min_val <= vi <= max_val:
+                    return vi
+            i = j + kv_len
 
     def _extract_world_dimensions_from_body(self, body: bytes) -> Optional[Tuple[int, int]]:
         """Structured scan of KSAV behaviors to find WidthInCells/HeightInCells key-values.
@@ -1978,56 +1991,11 @@ class OniSaveParser:
                 pass
 
             # Preserve the same decompressed body as world.data for size visibility
-            # without attempting to structurally decode the world. Also frame
-            # compressed blocks and compute diagnostics (sizes, CRCs).
+            # without attempting to structurally decode the world. Block
+            # diagnostics (sizes, CRCs) are framed once in _finalize_metadata.
             try:
                 file_bytes: bytes = getattr(self, "_last_file_bytes", b"")
                 if file_bytes:
-                    # Frame blocks
-                    import binascii
-                    import zlib
-
-                    blocks: List[SaveBlockInfo] = []
-                    start_after_header, _ = self._parse_header_raw(file_bytes)
-                    search = file_bytes[start_after_header:]
-                    seen = set()
-                    for sig in (b"\x78\x9c", b"\x78\xda", b"\x78\x01"):
-                        idx = 0
-                        while True:
-                            pos = search.find(sig, idx)
-                            if pos == -1:
-                                break
-                            abs_pos = start_after_header + pos
-                            if abs_pos in seen:
-                                idx = pos + 1
-                                continue
-                            seen.add(abs_pos)
-                            header_preview = file_bytes[abs_pos : abs_pos + 10].hex()
-                            # Try to decompress from this position to some cap; if fails, skip
-                            decompressed: bytes = b""
-                            comp_size = 0
-                            decomp_size = 0
-                            crc_hex = ""
-                            try:
-                                # We don't know the exact compressed block length; decompress from offset
-                                decompressed = zlib.decompress(file_bytes[abs_pos:])
-                                decomp_size = len(decompressed)
-                                # compressed_size unknown without container framing; estimate span until next block or end
-                                comp_size = len(file_bytes) - abs_pos
-                                crc_hex = format(binascii.crc32(decompressed) & 0xFFFFFFFF, "08x")
-                                blocks.append(
-                                    SaveBlockInfo(
-                                        offset=abs_pos,
-                                        header=header_preview,
-                                        compressed_size=comp_size,
-                                        decompressed_size=decomp_size,
-                                        crc32=crc_hex,
-                                    )
-                                )
-                            except Exception:
-                                pass
-                            idx = pos + 1
-
                     # Store KSAV body and cache
                     body = self._decompress_body_block(file_bytes) or b""
                     world.data = body
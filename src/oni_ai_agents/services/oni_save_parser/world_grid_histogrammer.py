@@ -9,8 +9,41 @@ temperatures, diseases, and radiation, and derive breathable percentage.
 
 from __future__ import annotations
 
+import struct
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+_HISTOGRAM_KEYS = ("elements", "temperatures", "diseases", "radiation")
+
+
+def _counts() -> array:
+    return array("q")
+
+
+@dataclass(slots=True)
+class WorldGridHistograms:
+    """
+    Per-cell histograms as dense int64 count arrays indexed by compact id.
+
+    Decoders tally into these arrays (one machine word per bin instead of a
+    dict entry per key); `to_dict()` produces the sparse dict-of-dicts shape
+    exposed in `world_grid_summary`.
+    """
+
+    elements: array = field(default_factory=_counts)
+    temperatures: array = field(default_factory=_counts)
+    diseases: array = field(default_factory=_counts)
+    radiation: array = field(default_factory=_counts)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Return `{key: {bin_id: count}}`, omitting empty bins."""
+        return {
+            key: {str(i): c for i, c in enumerate(getattr(self, key)) if c}
+            for key in _HISTOGRAM_KEYS
+        }
+
 
 def compute_histograms(sim_blob: bytes, width: int, height: int) -> Dict[str, Dict[str, int]]:
     """
@@ -27,13 +60,8 @@ def compute_histograms(sim_blob: bytes, width: int, height: int) -> Dict[str, Di
     Returns:
         Dict with keys: elements, temperatures, diseases, radiation
     """
-    # Placeholders to keep a stable contract for downstream consumers.
-    return {
-        "elements": {},
-        "temperatures": {},
-        "diseases": {},
-        "radiation": {},
-    }
+    # Placeholders (no bins yet) to keep a stable contract for downstream consumers.
+    return WorldGridHistograms().to_dict()
 
 
 def compute_breathable_percent(histograms: Dict[str, Dict[str, int]], total_cells: int) -> Optional[float]:
@@ -63,20 +91,23 @@ def compute_structures_histogram(object_group_counts: Dict[str, int], top_n: int
     return hist
 
 
+# Behaviors whose payloads carry a cell/object temperature, matched as raw name bytes
+_TEMPERATURE_BEHAVIORS = frozenset((b"PrimaryElement", b"Modifiers", b"Building", b"SimCellOccupier"))
+_TEMPERATURE_BEHAVIOR_LENGTHS = frozenset(len(name) for name in _TEMPERATURE_BEHAVIORS)
+_FLOAT32 = struct.Struct('<f')
+_INT32 = struct.Struct('<i')
+_INT32_PAIR = struct.Struct('<ii')
+
+
 def _scan_best_float32(buf_mv, start: int, end: int, min_val: float, max_val: float) -> Optional[float]:
-    import math
-    import struct
-    best = None
-    p = start
-    while p + 4 <= end:
-        try:
-            v = struct.unpack_from('<f', buf_mv, p)[0]
-            if math.isfinite(v) and min_val <= v <= max_val:
-                best = float(v)
-        except Exception:
-            pass
-        p += 1
-    return best
+    """Return the last float32 (at any byte offset) in [start, end) within [min_val, max_val]."""
+    unpack_from = _FLOAT32.unpack_from
+    # Scan backwards so the first hit is the last match; NaN fails the range test
+    for p in range(end - 4, start - 1, -1):
+        v = unpack_from(buf_mv, p)[0]
+        if min_val <= v <= max_val:
+            return float(v)
+    return None
 
 
 def compute_temperature_histogram_from_body(body: bytes, bucket_edges: Optional[List[float]] = None) -> Dict[str, int]:
@@ -93,7 +124,6 @@ def compute_temperature_histogram_from_body(body: bytes, bucket_edges: Optional[
     Returns:
         Dict mapping bucket label (e.g., '280-300K') to counts.
     """
-    import struct
     if not body:
         return {}
 
@@ -101,84 +131,74 @@ def compute_temperature_histogram_from_body(body: bytes, bucket_edges: Optional[
         # Kelvin buckets (approx): <240, 240-280, 280-300, 300-320, 320-360, >360
         bucket_edges = [240.0, 280.0, 300.0, 320.0, 360.0]
 
-    def bucket_label(k: float) -> str:
-        prev = None
-        for edge in bucket_edges:
-            if k < edge:
-                return (f"<{edge:.0f}K" if prev is None else f"{prev:.0f}-{edge:.0f}K")
-            prev = edge
-        return f">{bucket_edges[-1]:.0f}K"
+    # One label per bucket, indexed by bisect position
+    labels = [f"<{bucket_edges[0]:.0f}K"]
+    labels += [f"{lo:.0f}-{hi:.0f}K" for lo, hi in zip(bucket_edges, bucket_edges[1:])]
+    labels.append(f">{bucket_edges[-1]:.0f}K")
 
     mv = memoryview(body)
     pos = body.find(b'KSAV')
     if pos == -1:
         return {}
     p = pos + 4
-    if p + 12 > len(body):
-        return {}
-    try:
-        _maj = struct.unpack_from('<i', mv, p)[0]; p += 4
-        _min = struct.unpack_from('<i', mv, p)[0]; p += 4
-        group_count = struct.unpack_from('<i', mv, p)[0]; p += 4
-    except Exception:
+    body_len = len(body)
+    if p + 12 > body_len:
         return {}
+    _maj, _min, group_count = struct.unpack_from('<iii', mv, p)
+    p += 12
 
+    unpack_int = _INT32.unpack_from
+    unpack_pair = _INT32_PAIR.unpack_from
+    # Transform (12 + 16 + 12 + 1 bytes) followed by the behavior count
+    transform_size = 12 + 16 + 12 + 1
     counts: Dict[str, int] = {}
     for _ in range(max(0, group_count)):
-        if p + 4 > len(body):
+        if p + 4 > body_len:
             break
-        try:
-            name_len = struct.unpack_from('<i', mv, p)[0]; p += 4
-            if name_len < 0 or p + name_len > len(body):
-                break
-            # group name not used; skip
-            p += name_len
-            if p + 8 > len(body):
+        name_len = unpack_int(mv, p)[0]; p += 4
+        if name_len < 0 or p + name_len > body_len:
+            break
+        # group name not used; skip
+        p += name_len
+        if p + 8 > body_len:
+            break
+        instance_count, data_len = unpack_pair(mv, p); p += 8
+        group_start = p
+        for _i in range(max(0, instance_count)):
+            if p + transform_size + 4 > body_len:
                 break
-            instance_count = struct.unpack_from('<i', mv, p)[0]; p += 4
-            data_len = struct.unpack_from('<i', mv, p)[0]; p += 4
-            group_start = p
-            for _i in range(max(0, instance_count)):
-                if p + 12 + 16 + 12 + 1 + 4 > len(body):
+            p += transform_size
+            bcount = unpack_int(mv, p)[0]; p += 4
+            q = p
+            for _b in range(max(0, bcount)):
+                if q + 4 > body_len:
                     break
-                # Skip transform
-                p += 12 + 16 + 12 + 1
-                # Behavior count
-                try:
-                    bcount = struct.unpack_from('<i', mv, p)[0]; p += 4
-                except Exception:
+                blen = unpack_int(mv, q)[0]; q += 4
+                if blen < 0 or q + blen > body_len:
                     break
-                q = p
-                for _b in range(max(0, bcount)):
-                    if q + 4 > len(body):
-                        break
-                    blen = struct.unpack_from('<i', mv, q)[0]; q += 4
-                    if blen < 0 or q + blen > len(body):
-                        break
-                    bname = bytes(mv[q:q+blen]).decode('utf-8', errors='ignore'); q += blen
-                    if q + 4 > len(body):
-                        break
-                    plen = struct.unpack_from('<i', mv, q)[0]; q += 4
-                    bstart = q
-                    bend = q + max(0, plen)
-                    if bend > len(body):
-                        break
-                    # Heuristic: scan payload for plausible Kelvin temperatures
-                    # Only consider some behaviors to reduce noise
-                    if bname in ("PrimaryElement", "Modifiers", "Building", "SimCellOccupier"):
-                        t = _scan_best_float32(mv, bstart, bend, 100.0, 1000.0)
-                        if t is not None:
-                            lbl = bucket_label(t)
-                            counts[lbl] = counts.get(lbl, 0) + 1
-                    q = bend
-                p = q
-            # Skip remainder of group payload
-            p = group_start + max(0, data_len)
-            if p > len(body):
-                break
-        except Exception:
+                name_start = q
+                q += blen
+                if q + 4 > body_len:
+                    break
+                plen = unpack_int(mv, q)[0]; q += 4
+                bend = q + max(0, plen)
+                if bend > body_len:
+                    break
+                # Heuristic: scan payload for plausible Kelvin temperatures
+                # Only consider some behaviors to reduce noise
+                if (
+                    blen in _TEMPERATURE_BEHAVIOR_LENGTHS
+                    and mv[name_start:q - 4].tobytes() in _TEMPERATURE_BEHAVIORS
+                ):
+                    t = _scan_best_float32(mv, q, bend, 100.0, 1000.0)
+                    if t is not None:
+                        lbl = labels[bisect_right(bucket_edges, t)]
+                        counts[lbl] = counts.get(lbl, 0) + 1
+                q = bend
+            p = q
+        # Skip remainder of group payload
+        p = group_start + max(0, data_len)
+        if p > body_len:
             break
 
     return counts
-
-
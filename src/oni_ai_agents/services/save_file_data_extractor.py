@@ -10,9 +10,10 @@ This serves as a compatibility layer for observer agents expecting section data.
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from .oni_save_parser import OniSaveParser
+from .oni_save_parser.data_structures import ParseResult
 from .oni_save_parser.world_grid_histogrammer import (
     compute_breathable_percent,
     compute_histograms,
@@ -41,7 +42,18 @@ class SaveFileDataExtractor:
         from the parser's entity extraction. If a canonical list is available
         it is preferred; otherwise raw entries are mapped into canonical form.
         """
-        result = self._parser.parse_save_file(save_file_path)
+        return self.from_parse_result(self._parser.parse_save_file(save_file_path), save_file_path)
+
+    def from_parse_result(
+        self, result: ParseResult, save_file_path: Optional[Path] = None
+    ) -> ExtractedSaveData:
+        """Build the structured data container from an existing parse result.
+
+        This is a pure reshape of `result`, so a save parsed once (or loaded
+        from the parse cache) can be extracted without re-reading the file.
+        `save_file_path` is only used to recover duplicant details when the
+        result carries no duplicant entities.
+        """
         if not result.success or result.save_game is None:
             raise ValueError(f"Failed to parse save file: {result.error_message}")
 
@@ -49,7 +61,9 @@ class SaveFileDataExtractor:
         game_info = save_game.header.game_info
         # Prefer canonical duplicants structure if provided by parser
         canonical = result.entities.get("duplicants_canonical")
-        raw_minions = result.entities.get("duplicants") or self._parser.extract_minion_details(save_file_path)
+        raw_minions = result.entities.get("duplicants")
+        if not raw_minions and save_file_path is not None:
+            raw_minions = self._parser.extract_minion_details(save_file_path)
 
         def to_canonical(m: Dict[str, Any]) -> Dict[str, Any]:
             vitals: Dict[str, Any] = m.get("vitals", {}) if isinstance(m.get("vitals"), dict) else {}
@@ -1,8 +1,12 @@
+import asyncio
 import json
 import os
+import socket
 import sys
+import urllib.parse
 import urllib.request
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -15,52 +19,179 @@ if str(SRC_PATH) not in sys.path:
 # Speed up test suite by default
 os.environ.setdefault("FAST_TESTS", "1")
 
-# Optional: eliminate artificial model delays; avoid global caching that can
-# interfere with monkeypatching-based tests
-try:
-    from src.oni_ai_agents.models.local_model import LocalModel
 
-    _ORIG_LOCAL_INIT = LocalModel.__init__
+def pytest_addoption(parser):
+    parser.addoption(
+        "--keep-artifacts",
+        action="store_true",
+        default=False,
+        help="Write JSON result artifacts from the save tests under test_data/",
+    )
 
-    def _patched_local_init(self, config=None):
-        cfg = dict(config or {})
-        if os.getenv("FAST_TESTS", "0") == "1":
-            cfg["delay"] = 0.0
-        _ORIG_LOCAL_INIT(self, cfg)
 
-    LocalModel.__init__ = _patched_local_init  # type: ignore[assignment]
-except Exception:
-    # Non-fatal if modules move; tests will still run
-    pass
+def pytest_configure(config):
+    """Apply FAST_TESTS tweaks once per session.
+
+    Kept in a hook rather than at import time so importing this module as a
+    helper never re-applies test-only patches.
+    """
+    # Optional: run async tests on uvloop when it is installed (Linux/macOS)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    if os.getenv("FAST_TESTS", "0") != "1":
+        return
+    # Optional: eliminate artificial model delays by lowering the class-level
+    # default rather than wrapping LocalModel.__init__
+    try:
+        from src.oni_ai_agents.models.local_model import LocalModel
+
+        LocalModel._DEFAULT_DELAY = 0.0
+    except Exception:
+        # Non-fatal if modules move; tests will still run
+        pass
+
+
+@pytest.fixture
+def keep_artifacts(request) -> bool:
+    """Whether tests should write their JSON result artifacts (--keep-artifacts)."""
+    return request.config.getoption("--keep-artifacts")
+
+
+CLONE_LAB_SAVE = PROJECT_ROOT / "test_data" / "clone_laboratory.sav"
+PARSE_CACHE_DIR = PROJECT_ROOT / "test_data" / ".parse_cache"
+
+
+@pytest.fixture(scope="session")
+def save_parser():
+    """Share one OniSaveParser; each parse resets its per-file caches.
+
+    Tests that monkeypatch parser methods should construct their own instance.
+    """
+    from src.oni_ai_agents.services.oni_save_parser import OniSaveParser
+
+    parser = OniSaveParser()
+    yield parser
+    parser.reset()
+
+
+@pytest.fixture(scope="session")
+def parsed_clone_lab(save_parser):
+    """Parse the bundled clone_laboratory save once and share the ParseResult.
+
+    The result is also cached on disk, so later sessions skip the parse
+    entirely while the save and parser sources are unchanged.
+
+    Consumers must treat the result as read-only; tests that patch the parser
+    or need a different input should construct their own OniSaveParser.
+    """
+    if not CLONE_LAB_SAVE.exists():
+        pytest.skip("Real save file not present")
+    from src.oni_ai_agents.services.oni_save_parser import parse_save_file_cached
+
+    return parse_save_file_cached(CLONE_LAB_SAVE, PARSE_CACHE_DIR, parser=save_parser)
+
+
+@pytest.fixture(scope="session")
+def extracted_clone_lab(parsed_clone_lab):
+    """Extract clone_laboratory sections once per session from the shared parse.
+
+    Consumers must treat the sections as read-only.
+    """
+    from src.oni_ai_agents.services.save_file_data_extractor import SaveFileDataExtractor
+
+    return SaveFileDataExtractor().from_parse_result(parsed_clone_lab, CLONE_LAB_SAVE)
+
+
+# Known clone_laboratory header values, used in FAST_TESTS mode instead of a parse
+CLONE_LAB_SUMMARY = {"version": "7.36", "cycles": 151, "duplicants": 11}
+CLONE_LAB_GAME_INFO = {
+    "baseName": "The Clone Laboratory",
+    "clusterId": "expansion1::clusters/SandstoneStartCluster",
+}
+
+
+@pytest.fixture(scope="session")
+def mock_section_data(request):
+    """Build the mock observer-section inputs for clone_laboratory once per session.
+
+    FAST_TESTS (the default) uses the known header values; otherwise they come
+    from the shared session parse. The returned mapping is read-only and also
+    carries the `summary` and `game_info` the sections were derived from.
+    """
+    if os.getenv("FAST_TESTS", "1") == "1":
+        summary, game_info = CLONE_LAB_SUMMARY, CLONE_LAB_GAME_INFO
+    else:
+        result = request.getfixturevalue("parsed_clone_lab")
+        if not result.success:
+            pytest.skip(f"Failed to parse save file: {result.error_message}")
+        summary = result.save_game.get_summary()
+        game_info = result.save_game.header.game_info
+
+    base_name = game_info.get("baseName", "Unknown")
+    return MappingProxyType({
+        "summary": summary,
+        "game_info": game_info,
+        "resource": {
+            "cycles": summary["cycles"],
+            "base_name": base_name,
+            "cluster_id": game_info.get("clusterId", ""),
+            "food": 1000,  # Mock data - would come from actual parsing
+            "oxygen": 85,
+            "power": 60,
+            "duplicant_count": summary["duplicants"],
+        },
+        "duplicant": {
+            "count": summary["duplicants"],
+            "cycles_played": summary["cycles"],
+            "colony_name": base_name,
+            "health_status": {},  # Would be populated from actual game objects
+            "morale_levels": {},
+            "skill_assignments": {},
+        },
+        "threat": {
+            "colony_age_cycles": summary["cycles"],
+            "diseases": {},  # Would be populated from world data
+            "temperature_zones": {},
+            "pressure_issues": {},
+            "environment_stability": "unknown",
+        },
+    })
 
 
 @pytest.fixture(scope="session")
 def local_openai_available() -> bool:
     """Return True if a local OpenAI-compatible endpoint appears available.
 
-    Probes `${OPENAI_BASE_URL}/models` (assuming base includes `/v1`).
+    Probes `${OPENAI_BASE_URL}/models` (assuming base includes `/v1`). A short
+    TCP connect runs first so an absent server fails fast, then a single GET
+    confirms the endpoint answers with JSON.
     """
     base_url = os.getenv("OPENAI_BASE_URL")
     if not base_url:
         return False
     url = base_url.rstrip("/") + "/models"
-    # Try HEAD first, then GET
+    parts = urllib.parse.urlsplit(url)
+    if not parts.hostname:
+        return False
+    port = parts.port or (443 if parts.scheme == "https" else 80)
     try:
-        req = urllib.request.Request(url, method="HEAD")
-        with urllib.request.urlopen(req, timeout=1.5) as resp:  # nosec B310
-            if not (200 <= getattr(resp, "status", 200) < 500):
+        with socket.create_connection((parts.hostname, port), timeout=0.5):
+            pass
+    except OSError:
+        return False
+    try:
+        with urllib.request.urlopen(url, timeout=2.5) as resp:  # nosec B310
+            if not (200 <= getattr(resp, "status", 200) < 300):
                 return False
+            # Ensure it's JSON-like
+            data = json.loads(resp.read().decode("utf-8"))
+            return isinstance(data, dict)
     except Exception:
-        try:
-            with urllib.request.urlopen(url, timeout=2.5) as resp:  # nosec B310
-                if not (200 <= getattr(resp, "status", 200) < 300):
-                    return False
-                # Ensure it's JSON-like
-                data = json.loads(resp.read().decode("utf-8"))
-                return isinstance(data, dict)
-        except Exception:
-            return False
-    return True
+        return False
 
 
 @pytest.fixture(scope="session")
@@ -2,18 +2,26 @@
 Tests for the Agent class.
 """
 
+import json
 
 import pytest
 
 from src.oni_ai_agents.core.agent import Agent
 from src.oni_ai_agents.core.agent_types import AgentType
+from src.oni_ai_agents.models.local_model import LocalModel
+
+# Share one event loop across the module instead of creating one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# MockAgent never calls its model, so one instance serves every test
+_SHARED_LOCAL_MODEL = LocalModel({"delay": 0.0})
 
 
 class MockAgent(Agent):
     """Mock agent for testing."""
     
     async def process_input(self, input_data):
-        return {"response": f"Processed: {input_data}"}
+        return {"response": f"Processed: {json.dumps(input_data, separators=(',', ':'))}"}
     
     async def _on_start(self):
         pass
@@ -25,29 +33,40 @@ class MockAgent(Agent):
         pass
 
 
-@pytest.mark.asyncio
-async def test_agent_initialization():
-    """Test agent initialization."""
-    agent = MockAgent(
+@pytest.fixture
+def fresh_agent():
+    """Provide a stopped observing agent backed by the shared local model."""
+    return MockAgent(
         agent_id="test_agent",
         agent_type=AgentType.OBSERVING,
         model_provider="local",
-        model_config={"delay": 0.01}
+        model=_SHARED_LOCAL_MODEL
     )
+
+
+@pytest.fixture
+def mock_agent_pair():
+    """Provide an observing/core agent pair without a model backend."""
+    return (
+        MockAgent(agent_id="agent1", agent_type=AgentType.OBSERVING),
+        MockAgent(agent_id="agent2", agent_type=AgentType.CORE),
+    )
+
+
+async def test_agent_initialization(fresh_agent):
+    """Test agent initialization."""
+    agent = fresh_agent
     
     assert agent.agent_id == "test_agent"
     assert agent.agent_type == AgentType.OBSERVING
     assert agent.model_provider == "local"
     assert not agent.is_active
+    assert agent.model is _SHARED_LOCAL_MODEL
 
 
-@pytest.mark.asyncio
-async def test_agent_start_stop():
+async def test_agent_start_stop(fresh_agent):
     """Test agent start and stop functionality."""
-    agent = MockAgent(
-        agent_id="test_agent",
-        agent_type=AgentType.OBSERVING
-    )
+    agent = fresh_agent
     
     await agent.start()
     assert agent.is_active
@@ -56,18 +75,9 @@ async def test_agent_start_stop():
     assert not agent.is_active
 
 
-@pytest.mark.asyncio
-async def test_agent_message_passing():
+async def test_agent_message_passing(mock_agent_pair):
     """Test message passing between agents."""
-    agent1 = MockAgent(
-        agent_id="agent1",
-        agent_type=AgentType.OBSERVING
-    )
-    
-    agent2 = MockAgent(
-        agent_id="agent2",
-        agent_type=AgentType.CORE
-    )
+    agent1, agent2 = mock_agent_pair
     
     # Connect agents
     agent1.connect_to_agent(agent2)
@@ -77,33 +87,24 @@ async def test_agent_message_passing():
     
     # Check message was received
     assert len(agent2.message_queue) == 1
-    message = agent2.message_queue[0]
+    message = agent2.peek_message(0)
     assert message.sender_id == "agent1"
     assert message.recipient_id == "agent2"
     assert message.message_type == "test_message"
     assert message.content == {"data": "test"}
 
 
-@pytest.mark.asyncio
-async def test_agent_process_input():
+async def test_agent_process_input(fresh_agent):
     """Test agent input processing."""
-    agent = MockAgent(
-        agent_id="test_agent",
-        agent_type=AgentType.OBSERVING
-    )
+    agent = fresh_agent
     
     result = await agent.process_input({"test": "data"})
-    assert result == {"response": "Processed: {'test': 'data'}"}
+    assert result == {"response": 'Processed: {"test":"data"}'}
 
 
-@pytest.mark.asyncio
-async def test_agent_status():
+async def test_agent_status(fresh_agent):
     """Test agent status reporting."""
-    agent = MockAgent(
-        agent_id="test_agent",
-        agent_type=AgentType.OBSERVING,
-        model_provider="local"
-    )
+    agent = fresh_agent
     
     status = agent.get_status()
     assert status["agent_id"] == "test_agent"
@@ -111,4 +112,45 @@ async def test_agent_status():
     assert status["is_active"] is False
     assert status["model_provider"] == "local"
     assert status["connected_agents"] == []
-    assert status["message_queue_size"] == 0 
\ No newline at end of file
+    assert status["message_queue_size"] == 0
+
+
+async def test_agent_status_refreshes_after_state_changes(mock_agent_pair):
+    """Test cached status is rebuilt after start, connect and messages."""
+    agent1, agent2 = mock_agent_pair
+    assert agent2.get_status()["is_active"] is False
+    
+    await agent2.start()
+    agent1.connect_to_agent(agent2)
+    await agent1.send_message("agent2", "test_message", {"data": "test"})
+    
+    status = agent2.get_status()
+    assert status["is_active"] is True
+    assert status["connected_agents"] == ["agent1"]
+    assert status["message_queue_size"] == 1
+    
+    agent2.disconnect_from_agent("agent1")
+    assert agent1.get_status()["connected_agents"] == []
+
+
+async def test_agent_status_snapshot_is_not_shared(mock_agent_pair):
+    """Test mutating a returned status does not touch the cached snapshot."""
+    agent1, agent2 = mock_agent_pair
+    agent1.connect_to_agent(agent2)
+    
+    agent1.get_status()["connected_agents"].append("ghost")
+    
+    assert agent1.get_status()["connected_agents"] == ["agent2"]
+
+
+async def test_connect_to_agents_links_all_peers():
+    """Test batch connection is bidirectional for every peer."""
+    hub = MockAgent("hub", AgentType.CORE)
+    peers = [MockAgent(f"peer{i}", AgentType.OBSERVING) for i in range(3)]
+    assert hub.get_status()["connected_agents"] == []
+    
+    hub.connect_to_agents(*peers)
+    
+    assert hub.get_status()["connected_agents"] == ["peer0", "peer1", "peer2"]
+    for peer in peers:
+        assert peer.get_status()["connected_agents"] == ["hub"]
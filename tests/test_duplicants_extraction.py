@@ -7,13 +7,9 @@ import pytest
 
 from src.oni_ai_agents.services.oni_save_parser import OniSaveParser
 
-SAVE_PATH = Path("test_data/clone_laboratory.sav")
 
-
-@pytest.mark.skipif(not SAVE_PATH.exists(), reason="Real save file not present")
-def test_duplicants_canonical_presence_and_shape():
-    parser = OniSaveParser()
-    result = parser.parse_save_file(SAVE_PATH)
+def test_duplicants_canonical_presence_and_shape(parsed_clone_lab):
+    result = parsed_clone_lab
     assert result.success, f"parse failed: {result.error_message}"
 
     # Legacy list remains
@@ -99,8 +95,8 @@ def test_canonical_defaults_without_resume_modifiers(monkeypatch, tmp_path: Path
     assert isinstance(e.get("effects", []), list)
 
 
-def test_helpers_bounded_read_no_raise():
-    parser = OniSaveParser()
+def test_helpers_bounded_read_no_raise(save_parser):
+    parser = save_parser
     mv = memoryview(b"\x00\x00\x00\x00garbagepayload")
     out = parser._parse_minion_identity(mv, 0, 4)  # end before payload
     assert isinstance(out, dict)
@@ -138,3 +134,10 @@ def test_known_ids_importerror_fallback(monkeypatch):
     assert parser._KNOWN_EFFECT_IDS
 
 
+def test_shared_parser_does_not_leak_previous_save(save_parser, parsed_clone_lab, tmp_path: Path):
+    # Parsing another file with the same instance must not reuse the cached body
+    dummy = tmp_path / "dummy.sav"
+    dummy.write_bytes(b"FAKE")
+    save_parser.parse_save_file(dummy)
+    assert save_parser.extract_minion_details(dummy) == []
+    assert save_parser.last_game_info == {}
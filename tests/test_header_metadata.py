@@ -1,13 +1,10 @@
-import os
 from pathlib import Path
 
 from src.oni_ai_agents.services.oni_save_parser import OniSaveParser
 
 
-def test_header_and_metadata_completeness():
-    save_path = Path("test_data/clone_laboratory.sav")
-    parser = OniSaveParser()
-    result = parser.parse_save_file(save_path)
+def test_header_and_metadata_completeness(parsed_clone_lab):
+    result = parsed_clone_lab
 
     assert result.success, f"Parser failed: {result.error_message}"
     sg = result.save_game
@@ -52,17 +49,8 @@ def test_version_fallback_and_warning_when_header_missing_versions(monkeypatch):
 
     monkeypatch.setattr(parser, "_parse_header", _wrapped)
 
-    # In FAST_TESTS mode, run the real parse for this test only to exercise fallback
-    prev_fast = os.getenv("FAST_TESTS")
-    try:
-        if prev_fast == "1":
-            os.environ["FAST_TESTS"] = "0"
-        result = parser.parse_save_file(save_path)
-    finally:
-        if prev_fast is not None:
-            os.environ["FAST_TESTS"] = prev_fast
-        else:
-            os.environ.pop("FAST_TESTS", None)
+    # The parser has no FAST_TESTS mode, so this is always a real parse
+    result = parser.parse_save_file(save_path)
     assert result.success
     sg = result.save_game
     assert sg is not None
@@ -7,6 +7,7 @@ image processing, AI model integration, and message handling.
 
 import asyncio
 import base64
+import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -14,27 +15,40 @@ import pytest
 from src.oni_ai_agents.core.agent import AgentMessage
 from src.oni_ai_agents.core.agent_types import AgentType
 
+# Image validation needs Pillow; skip the module cleanly when it is missing
+pytest.importorskip("PIL")
 
-# Module-level fixtures used by multiple classes
-@pytest.fixture
+# Async tests below are marked loop_scope="module" so they share one event
+# loop instead of each creating (and tearing down) a fresh one
+
+
+# Module-level fixtures used by multiple classes; session-scoped because the
+# sample image is read-only, so it is loaded and encoded once per run
+@pytest.fixture(scope="session")
 def sample_image_path():
     """Provide path to sample ONI base image (shared)."""
     return "The Clone Laboratory.png"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_data(sample_image_path):
     """Load sample image as bytes (shared)."""
     with open(sample_image_path, 'rb') as f:
         return f.read()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_base64(sample_image_data):
     """Convert sample image to base64 (shared)."""
     return base64.b64encode(sample_image_data).decode('utf-8')
 
 
+@pytest.fixture(scope="session")
+def sample_image_sha256(sample_image_data):
+    """Reference SHA-256 of the sample image (shared)."""
+    return hashlib.sha256(sample_image_data).hexdigest()
+
+
 class TestImageObserverAgent:
     """Test suite for the Image Observer Agent."""
     
@@ -73,15 +87,16 @@ class TestImageObserverAgent:
         assert image_observer_agent.model_provider == "openai"
         assert image_observer_agent.is_active is False
     
-    def test_agent_start_stop(self, image_observer_agent):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_agent_start_stop(self, image_observer_agent):
         """Test agent start and stop functionality."""
-        asyncio.run(image_observer_agent.start())
+        await image_observer_agent.start()
         assert image_observer_agent.is_active is True
         
-        asyncio.run(image_observer_agent.stop())
+        await image_observer_agent.stop()
         assert image_observer_agent.is_active is False
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_process_image_input_base64(self, image_observer_agent, sample_image_base64, mock_ai_model):
         """Test processing image input in base64 format."""
         input_data = {
@@ -104,7 +119,7 @@ class TestImageObserverAgent:
         assert isinstance(result["summary"], str)
         assert len(result["summary"]) > 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_process_image_input_bytes(self, image_observer_agent, sample_image_data, mock_ai_model):
         """Test processing image input as bytes."""
         input_data = {
@@ -122,7 +137,7 @@ class TestImageObserverAgent:
         assert "timestamp" in result
         assert "image_hash" in result
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_process_image_input_file_path(self, image_observer_agent, sample_image_path, mock_ai_model):
         """Test processing image input as file path."""
         input_data = {
@@ -140,7 +155,7 @@ class TestImageObserverAgent:
         assert "timestamp" in result
         assert "image_hash" in result
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_image_validation_invalid_format(self, image_observer_agent):
         """Test handling of invalid image format."""
         input_data = {
@@ -151,7 +166,7 @@ class TestImageObserverAgent:
         with pytest.raises(ValueError, match="Invalid image format"):
             await image_observer_agent.process_input(input_data)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_image_validation_missing_image(self, image_observer_agent):
         """Test handling of missing image data."""
         input_data = {
@@ -161,29 +176,29 @@ class TestImageObserverAgent:
         with pytest.raises(ValueError, match="No image data provided"):
             await image_observer_agent.process_input(input_data)
     
-    @pytest.mark.asyncio
-    async def test_ai_model_error_handling(self, image_observer_agent, sample_image_base64):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ai_model_error_handling(self, image_observer_agent, sample_image_data):
         """Test handling of AI model errors."""
         # Mock AI model to raise an exception
         image_observer_agent.vision_model.generate_with_vision.side_effect = Exception("AI model error")
         
         input_data = {
-            "image": sample_image_base64,
+            "image": sample_image_data,
             "analysis_type": "base_overview"
         }
         
         with pytest.raises(Exception, match="AI model error"):
             await image_observer_agent.process_input(input_data)
     
-    @pytest.mark.asyncio
-    async def test_message_processing(self, image_observer_agent, sample_image_base64):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_message_processing(self, image_observer_agent, sample_image_data):
         """Test processing messages from other agents."""
         message = AgentMessage(
             sender_id="core_agent",
             recipient_id="test_image_observer",
             message_type="analyze_image",
             content={
-                "image": sample_image_base64,
+                "image": sample_image_data,
                 "analysis_type": "base_overview"
             }
         )
@@ -192,10 +207,10 @@ class TestImageObserverAgent:
         
         # Verify message was processed
         assert len(image_observer_agent.message_queue) == 1
-        assert image_observer_agent.message_queue[0].message_type == "analyze_image"
+        assert image_observer_agent.peek_message(0).message_type == "analyze_image"
     
-    @pytest.mark.asyncio
-    async def test_agent_communication(self, image_observer_agent, sample_image_base64):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_agent_communication(self, image_observer_agent):
         """Test communication between agents."""
         # Create a mock core agent
         mock_core_agent = MagicMock()
@@ -218,13 +233,12 @@ class TestImageObserverAgent:
         assert sent_message.message_type == "image_analysis_complete"
         assert sent_message.content["summary"] == "Test analysis"
     
-    def test_image_hash_generation(self, image_observer_agent, sample_image_data):
+    def test_image_hash_generation(self, image_observer_agent, sample_image_data, sample_image_sha256):
         """Test image hash generation for tracking changes."""
         hash1 = image_observer_agent._hash_image(sample_image_data)
-        hash2 = image_observer_agent._hash_image(sample_image_data)
         
-        # Same image should produce same hash
-        assert hash1 == hash2
+        # Same image should produce the same (precomputed) hash
+        assert hash1 == sample_image_sha256
         assert len(hash1) == 64  # SHA-256 hash length
         
         # Different data should produce different hash
@@ -232,40 +246,28 @@ class TestImageObserverAgent:
         hash3 = image_observer_agent._hash_image(different_data)
         assert hash1 != hash3
     
-    @pytest.mark.asyncio
-    async def test_different_analysis_types(self, image_observer_agent, sample_image_base64, mock_ai_model):
+    @pytest.mark.parametrize(
+        "analysis_type, needles",
+        [
+            ("base_overview", ("overall base state",)),
+            ("unknown_type", ("analyze",)),
+            ("resource_analysis", ("resource",)),
+            ("threat_assessment", ("threat", "danger")),
+            ("efficiency_analysis", ("efficiency",)),
+        ],
+    )
+    def test_different_analysis_types(self, analysis_type, needles):
         """Test different analysis types with appropriate prompts."""
-        analysis_types = [
-            "base_overview",
-            "resource_analysis", 
-            "threat_assessment",
-            "efficiency_analysis"
-        ]
-        
-        for analysis_type in analysis_types:
-            input_data = {
-                "image": sample_image_base64,
-                "analysis_type": analysis_type
-            }
-            
-            await image_observer_agent.process_input(input_data)
-            
-            # Verify AI model was called with appropriate prompt
-            call_args = mock_ai_model.generate_with_vision.call_args
-            prompt = call_args[0][0]
-            
-            if analysis_type == "resource_analysis":
-                assert "resource" in prompt.lower()
-            elif analysis_type == "threat_assessment":
-                assert "threat" in prompt.lower() or "danger" in prompt.lower()
-            elif analysis_type == "efficiency_analysis":
-                assert "efficiency" in prompt.lower()
-            
-            # Reset mock for next iteration
-            mock_ai_model.generate_with_vision.reset_mock()
+        from src.oni_ai_agents.agents.image_observer_agent import ImageObserverAgent
+
+        # The prompt is a pure function of the analysis type, so no agent is
+        # built; the full process_input path is covered by the image input tests
+        prompt = ImageObserverAgent._create_analysis_prompt(analysis_type).lower()
+        assert "oxygen not included" in prompt
+        assert any(needle in prompt for needle in needles)
     
-    @pytest.mark.asyncio
-    async def test_confidence_scoring(self, image_observer_agent, sample_image_base64):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_confidence_scoring(self, image_observer_agent, sample_image_data):
         """Test confidence scoring in analysis results."""
         # Mock AI model to return confidence score
         image_observer_agent.vision_model.generate_with_vision.return_value = {
@@ -274,7 +276,7 @@ class TestImageObserverAgent:
         }
         
         input_data = {
-            "image": sample_image_base64,
+            "image": sample_image_data,
             "analysis_type": "base_overview"
         }
         
@@ -295,27 +297,38 @@ class TestImageObserverAgent:
         assert status["agent_id"] == "test_image_observer"
         assert status["agent_type"] == "observing"
     
-    @pytest.mark.asyncio
-    async def test_concurrent_image_processing(self, image_observer_agent, sample_image_base64):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concurrent_image_processing(self, image_observer_agent, sample_image_data):
         """Test concurrent processing of multiple images."""
         input_data = {
-            "image": sample_image_base64,
+            "image": sample_image_data,
             "analysis_type": "base_overview"
         }
         
-        # Process multiple images concurrently
-        tasks = [
-            image_observer_agent.process_input(input_data)
-            for _ in range(3)
-        ]
-        
-        results = await asyncio.gather(*tasks)
+        # Process multiple images concurrently; the image is validated and
+        # hashed once, later calls reuse the cached result
+        with patch.object(
+            image_observer_agent,
+            "_validate_image_format",
+            wraps=image_observer_agent._validate_image_format,
+        ) as validate:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(image_observer_agent.process_input(input_data))
+                    for _ in range(3)
+                ]
+        
+        validate.assert_called_once()
         
         # Verify all results are valid
-        for result in results:
+        hashes = set()
+        for task in tasks:
+            result = task.result()
             assert "summary" in result
             assert "timestamp" in result
             assert "image_hash" in result
+            hashes.add(result["image_hash"])
+        assert len(hashes) == 1
     
     def test_image_format_validation(self, image_observer_agent):
         """Test validation of different image formats."""
@@ -328,14 +341,14 @@ class TestImageObserverAgent:
         # Note: Valid PNG testing is complex due to checksums
         # We'll test with actual image files in integration tests
     
-    @pytest.mark.asyncio
-    async def test_error_logging(self, image_observer_agent, sample_image_base64, caplog):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_error_logging(self, image_observer_agent, sample_image_data, caplog):
         """Test that errors are properly logged."""
         # Mock AI model to raise an exception
         image_observer_agent.vision_model.generate_with_vision.side_effect = Exception("Test error")
         
         input_data = {
-            "image": sample_image_base64,
+            "image": sample_image_data,
             "analysis_type": "base_overview"
         }
         
@@ -361,7 +374,7 @@ class TestImageObserverAgentIntegration:
             model_config={"model": "gpt-4-vision-preview"}
         )
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_end_to_end_image_analysis(self, real_image_observer_agent, sample_image_path):
         """Test complete end-to-end image analysis workflow."""
         # Load image as base64
@@ -392,8 +405,8 @@ class TestImageObserverAgentIntegration:
             assert len(call_args[0]) == 2  # prompt and image
             assert "analyze" in call_args[0][0].lower()
     
-    @pytest.mark.asyncio
-    async def test_agent_network_communication(self, real_image_observer_agent, sample_image_base64):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_agent_network_communication(self, real_image_observer_agent, sample_image_data):
         """Test communication in a network of agents."""
         # Create mock core agent
         mock_core_agent = MagicMock()
@@ -409,7 +422,7 @@ class TestImageObserverAgentIntegration:
             
             # Process image and send result to core agent
             input_data = {
-                "image": sample_image_base64,
+                "image": sample_image_data,
                 "analysis_type": "base_overview"
             }
             
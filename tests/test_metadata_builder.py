@@ -0,0 +1,40 @@
+import json
+import os
+import struct
+import zlib
+
+from src.oni_ai_agents.services.oni_save_parser import metadata_builder
+from src.oni_ai_agents.services.oni_save_parser.metadata_builder import MetadataBuilder
+
+
+def _fake_save(*payloads: bytes) -> bytes:
+    """Build a minimal save: header ints, JSON header, then zlib streams."""
+    header = json.dumps({"baseName": "Test"}).encode()
+    streams = b"".join(zlib.compress(p) for p in payloads)
+    return struct.pack("<IIII", 1, len(header), 1, 1) + header + streams
+
+
+def test_block_crcs_match_between_serial_and_pooled_paths(monkeypatch):
+    payloads = (b"KSAV" + b"\x00" * 4096, bytes(range(256)) * 64)
+    data = _fake_save(*payloads)
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    serial = MetadataBuilder().build(data, None).blocks
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    pooled = MetadataBuilder().build(data, None).blocks
+
+    assert pooled == serial
+    # Each stream decompresses (ignoring what follows it) to its own payload
+    assert [b.crc32 for b in serial] == [f"{zlib.crc32(p):08x}" for p in payloads]
+
+
+def test_chunked_decompression_matches_one_shot(monkeypatch):
+    payload = bytes(range(256)) * 1024
+    stream = zlib.compress(payload)
+    monkeypatch.setattr(metadata_builder, "_DECOMPRESS_CHUNK", 1000)
+
+    # Trailing bytes after the stream are ignored, as with zlib.decompress
+    stats = metadata_builder._decompress_one(memoryview(stream + b"trailing"))
+    assert stats == (len(payload), f"{zlib.crc32(payload):08x}")
+    # A stream cut short of its end marker is rejected
+    assert metadata_builder._decompress_one(memoryview(stream[:-4])) is None
@@ -1,14 +1,5 @@
-from pathlib import Path
-
-from src.oni_ai_agents.services.oni_save_parser import OniSaveParser
-
-
-def test_object_group_counts_present_from_real_save():
-    save_path = Path("test_data/clone_laboratory.sav")
-    assert save_path.exists(), "Real save file missing under test_data/."
-
-    parser = OniSaveParser()
-    result = parser.parse_save_file(save_path)
+def test_object_group_counts_present_from_real_save(parsed_clone_lab):
+    result = parsed_clone_lab
 
     assert result.success, f"Parser failed: {result.error_message}"
     ogc = result.entities.get("object_group_counts", {})
@@ -18,22 +9,18 @@ def test_object_group_counts_present_from_real_save():
     assert len(ogc) > 0, "object_group_counts should not be empty for real save"
 
 
-def test_object_group_counts_no_ksav_returns_empty():
-    parser = OniSaveParser()
+def test_object_group_counts_no_ksav_returns_empty(save_parser):
+    parser = save_parser
     # Provide a minimal body without 'KSAV'
     empty_counts = parser._extract_object_group_counts_from_body(b"NOT_KSAV.....")
     assert empty_counts == {}
 
 
-def test_object_group_counts_truncated_payload_returns_empty():
-    parser = OniSaveParser()
+def test_object_group_counts_truncated_payload_returns_empty(save_parser):
+    parser = save_parser
     # Build a truncated KSAV header: 'KSAV' + major + minor + group_count=1, then cut off
     import struct
-    body = bytearray()
-    body.extend(b"KSAV")
-    body.extend(struct.pack('<i', 7))  # major
-    body.extend(struct.pack('<i', 36))  # minor
-    body.extend(struct.pack('<i', 1))  # 1 group, but no group data
-    counts = parser._extract_object_group_counts_from_body(bytes(body))
+    body = struct.pack('<4siii', b"KSAV", 7, 36, 1)  # 1 group, but no group data
+    counts = parser._extract_object_group_counts_from_body(body)
     assert counts == {}
 
@@ -1,6 +1,7 @@
 from types import ModuleType, SimpleNamespace
 from typing import Optional
 import asyncio
+import sys
 
 import pytest
 
@@ -81,16 +82,47 @@ def _make_fake_openai_module(
     return fake_mod
 
 
-@pytest.mark.asyncio
-async def test_openai_local_responses_api(monkeypatch):
-    # Arrange: fake openai with Responses API
-    expected_text = "hello from responses"
-    fake_openai = _make_fake_openai_module(provide_responses=True, provide_chat=False, text=expected_text)
-    monkeypatch.setitem(__import__("sys").modules, "openai", fake_openai)
-    # Ensure no real API key is picked up
+# Fake `openai` modules are built once per scenario and reinstalled per test
+_FAKE_OPENAI_RESPONSES = _make_fake_openai_module(
+    provide_responses=True, provide_chat=False, text="hello from responses"
+)
+_FAKE_OPENAI_CHAT = _make_fake_openai_module(
+    provide_responses=False, provide_chat=True, text="hello from chat"
+)
+_FAKE_OPENAI_BOTH = _make_fake_openai_module(provide_responses=True, provide_chat=True, text="ok")
+
+
+@pytest.fixture
+def install_fake_openai(monkeypatch):
+    """Return an installer that puts a prebuilt fake `openai` in sys.modules.
+
+    Keyword overrides are forwarded to every `AsyncOpenAI(...)` construction
+    (e.g. `responses_raise=True`); the shared fake module itself is only
+    patched through monkeypatch, so scenarios never leak between tests.
+    """
+    # Ensure no real API key or endpoint is picked up
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
     monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
 
+    def _install(fake_mod: ModuleType, **client_overrides) -> ModuleType:
+        monkeypatch.setitem(sys.modules, "openai", fake_mod)
+        if client_overrides:
+            client_cls = fake_mod.AsyncOpenAI
+
+            def _factory(**kwargs):
+                return client_cls(**{**kwargs, **client_overrides})
+
+            monkeypatch.setattr(fake_mod, "AsyncOpenAI", _factory)
+        return fake_mod
+
+    return _install
+
+
+@pytest.mark.asyncio
+async def test_openai_local_responses_api(install_fake_openai):
+    # Arrange: fake openai with Responses API
+    install_fake_openai(_FAKE_OPENAI_RESPONSES)
+
     model = OpenAIModel({"base_url": "http://localhost:8000/v1", "model": "gpt-oss"})
 
     # Act: call generate_response
@@ -99,83 +131,52 @@ async def test_openai_local_responses_api(monkeypatch):
     # Assert: client is the fake (non-stub) and text matches
     client = await model._get_client()
     assert hasattr(client, "responses") and not hasattr(client, "chat")
-    assert out == expected_text
+    assert out == "hello from responses"
 
 
 @pytest.mark.asyncio
-async def test_openai_local_chat_completions_api(monkeypatch):
+async def test_openai_local_chat_completions_api(install_fake_openai):
     # Arrange: fake openai with Chat Completions API only
-    expected_text = "hello from chat"
-    fake_openai = _make_fake_openai_module(provide_responses=False, provide_chat=True, text=expected_text)
-    monkeypatch.setitem(__import__("sys").modules, "openai", fake_openai)
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    install_fake_openai(_FAKE_OPENAI_CHAT)
 
     model = OpenAIModel({"base_url": "http://localhost:8000/v1", "model": "gpt-oss"})
     out = await model.generate_response("ping", temperature=0.1, max_tokens=16)
     client = await model._get_client()
     assert hasattr(client, "chat") and not hasattr(client, "responses")
-    assert out == expected_text
+    assert out == "hello from chat"
 
 
 @pytest.mark.asyncio
-async def test_fallback_from_responses_to_chat(monkeypatch):
+async def test_fallback_from_responses_to_chat(install_fake_openai):
     # Arrange: responses.create raises; chat returns ok
-    expected_text = "ok"
-    fake_openai = _make_fake_openai_module(provide_responses=True, provide_chat=True, text=expected_text)
-
-    # Monkeypatch constructor to inject raising behavior
-    def _factory(**kwargs):
-        return fake_openai.AsyncOpenAI(**{**kwargs, "responses_raise": True})
-
-    monkeypatch.setitem(__import__("sys").modules, "openai", fake_openai)
-    # Swap class to a factory wrapper that forwards responses_raise
-    openai_mod = __import__("openai")
-    openai_mod.AsyncOpenAI = _factory  # type: ignore[assignment]
-
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    install_fake_openai(_FAKE_OPENAI_BOTH, responses_raise=True)
 
     model = OpenAIModel({"base_url": "http://localhost:8000/v1", "model": "gpt-oss"})
     out = await model.generate_response("ping")
-    assert out == expected_text
+    assert out == "ok"
 
 
 @pytest.mark.asyncio
-async def test_force_chat_skips_responses(monkeypatch):
+async def test_force_chat_skips_responses(install_fake_openai):
     # Arrange: provide both, but force_chat=True should call only chat
-    expected_text = "ok"
-    fake_openai = _make_fake_openai_module(provide_responses=True, provide_chat=True, text=expected_text)
-    monkeypatch.setitem(__import__("sys").modules, "openai", fake_openai)
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    install_fake_openai(_FAKE_OPENAI_BOTH)
 
     model = OpenAIModel({"base_url": "http://localhost:8000/v1", "model": "gpt-oss", "force_chat": True})
     out = await model.generate_response("ping")
-    assert out == expected_text
+    assert out == "ok"
 
 
 @pytest.mark.asyncio
-async def test_timeout_wrapper_on_responses(monkeypatch):
+async def test_timeout_wrapper_on_responses(install_fake_openai):
     # Arrange: responses path sleeps longer than timeout, ensure surfaced error string not hang
-    fake_text = "should not appear"
-    fake_openai = _make_fake_openai_module(provide_responses=True, provide_chat=False, text=fake_text)
-
-    # Inject a constructor that adds a sleep to responses
-    def _factory(**kwargs):
-        return fake_openai.AsyncOpenAI(**{**kwargs, "responses_sleep": 1.5})
+    install_fake_openai(_FAKE_OPENAI_RESPONSES, responses_sleep=1.5)
 
-    monkeypatch.setitem(__import__("sys").modules, "openai", fake_openai)
-    openai_mod = __import__("openai")
-    openai_mod.AsyncOpenAI = _factory  # type: ignore[assignment]
-
-    # Set a short timeout via config and env isolation
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    # Set a short timeout via config
     model = OpenAIModel({"base_url": "http://localhost:8000/v1", "model": "gpt-oss", "request_timeout": 0.25})
 
     out = await model.generate_response("ping")
     assert isinstance(out, str)
+    assert "hello from responses" not in out
     # We expect a timeout error to surface through fallback or direct error string
     assert "timed out" in out.lower() or out.startswith("Error generating response:")
 
@@ -0,0 +1,69 @@
+import os
+from pathlib import Path
+
+from src.oni_ai_agents.services.oni_save_parser import parse_save_file_cached
+from src.oni_ai_agents.services.oni_save_parser.data_structures import ParseResult
+
+
+class CountingParser:
+    """Stand-in parser that records how often it is asked to parse."""
+
+    def __init__(self, success: bool = True):
+        self.calls = 0
+        self.success = success
+
+    def parse_save_file(self, path):
+        self.calls += 1
+        return ParseResult(success=self.success, warnings=[f"parse #{self.calls}"])
+
+
+def test_cache_hit_skips_parser_until_save_changes(tmp_path: Path):
+    save = tmp_path / "colony.sav"
+    save.write_bytes(b"\x00" * 64)
+    cache_dir = tmp_path / "cache"
+    parser = CountingParser()
+
+    first = parse_save_file_cached(save, cache_dir, parser=parser)
+    second = parse_save_file_cached(save, cache_dir, parser=parser)
+    assert parser.calls == 1
+    assert second.warnings == first.warnings == ["parse #1"]
+
+    # Touching the save invalidates the entry
+    st = save.stat()
+    os.utime(save, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    third = parse_save_file_cached(save, cache_dir, parser=parser)
+    assert parser.calls == 2
+    assert third.warnings == ["parse #2"]
+
+
+def test_changed_save_replaces_cache_entry(tmp_path: Path):
+    save = tmp_path / "colony.sav"
+    save.write_bytes(b"\x00" * 64)
+    cache_dir = tmp_path / "cache"
+    parser = CountingParser()
+
+    parse_save_file_cached(save, cache_dir, parser=parser)
+    entries = list(cache_dir.iterdir())
+    assert len(entries) == 1
+
+    save.write_bytes(b"\x01" * 128)
+    result = parse_save_file_cached(save, cache_dir, parser=parser)
+    assert parser.calls == 2
+    assert result.warnings == ["parse #2"]
+    assert list(cache_dir.iterdir()) == entries
+
+    assert parse_save_file_cached(save, cache_dir, parser=parser).warnings == ["parse #2"]
+    assert parser.calls == 2
+
+
+def test_failed_parse_is_not_cached(tmp_path: Path):
+    save = tmp_path / "broken.sav"
+    save.write_bytes(b"junk")
+    cache_dir = tmp_path / "cache"
+    parser = CountingParser(success=False)
+
+    parse_save_file_cached(save, cache_dir, parser=parser)
+    parse_save_file_cached(save, cache_dir, parser=parser)
+
+    assert parser.calls == 2
+    assert not cache_dir.exists()
@@ -1,12 +1,5 @@
-from pathlib import Path
-
-from src.oni_ai_agents.services.oni_save_parser import OniSaveParser
-
-
-def test_entities_contract_and_world_grid_summary():
-    save_path = Path("test_data/clone_laboratory.sav")
-    parser = OniSaveParser()
-    result = parser.parse_save_file(save_path)
+def test_entities_contract_and_world_grid_summary(parsed_clone_lab):
+    result = parsed_clone_lab
 
     assert result.success, result.error_message
     # object_group_counts may be empty if KSAV missing, but in real test save it should exist
@@ -6,11 +6,11 @@ import asyncio
 
 import pytest
 
-from src.oni_ai_agents.models.local_model import LocalModel
 from src.oni_ai_agents.models.rate_limiter import (
     RateLimitConfig,
     RateLimitedModel,
     RateLimiter,
+    RateLimitExceeded,
     RateLimitStrategy,
 )
 
@@ -34,7 +34,7 @@ class TestRateLimiter:
         assert config.burst_limit == 5
         assert config.strategy == RateLimitStrategy.SLIDING_WINDOW
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_basic_rate_limiting(self):
         """Test basic rate limiting functionality."""
         config = RateLimitConfig(
@@ -51,7 +51,7 @@ class TestRateLimiter:
         # Should block the 4th request
         assert not await rate_limiter.acquire(timeout=0.1)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_sliding_window_rate_limiting(self):
         """Test sliding window rate limiting."""
         config = RateLimitConfig(
@@ -73,7 +73,7 @@ class TestRateLimiter:
         # Should still be blocked due to sliding window
         assert not await rate_limiter.acquire(timeout=0.1)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_token_bucket_rate_limiting(self):
         """Test token bucket rate limiting."""
         config = RateLimitConfig(
@@ -81,7 +81,9 @@ class TestRateLimiter:
             strategy=RateLimitStrategy.TOKEN_BUCKET
         )
         
-        rate_limiter = RateLimiter(config)
+        # Virtual clock so the refill needs no real waiting
+        clock = [0.0]
+        rate_limiter = RateLimiter(config, time_fn=lambda: clock[0])
         
         # Should allow first request
         assert await rate_limiter.acquire(timeout=0.1)
@@ -89,13 +91,33 @@ class TestRateLimiter:
         # Second request should be blocked immediately
         assert not await rate_limiter.acquire(timeout=0.1)
         
-        # Wait for token to refill
-        await asyncio.sleep(1.1)
+        # Let a token refill
+        clock[0] += 1.1
         
         # Should allow another request
         assert await rate_limiter.acquire(timeout=0.1)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_token_bucket_without_refill_times_out(self):
+        """Test a zero refill rate blocks once the burst is spent instead of failing."""
+        rate_limiter = RateLimiter(RateLimitConfig(
+            requests_per_minute=0,
+            burst_limit=1,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
+        ))
+        
+        while await rate_limiter.acquire(timeout=0.01):
+            pass
+        
+        assert not await rate_limiter.acquire(timeout=0.01)
+        # Callers queued behind an unbounded waiter also just time out
+        blocked = asyncio.create_task(rate_limiter.acquire())
+        await asyncio.sleep(0)
+        assert not await rate_limiter.acquire(timeout=0.01)
+        assert not blocked.done()
+        blocked.cancel()
+    
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_rate_limiter_status(self):
         """Test rate limiter status reporting."""
         config = RateLimitConfig(
@@ -123,13 +145,33 @@ class TestRateLimiter:
         assert status["requests_last_minute"] == 1
         assert status["current_burst"] == 1
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_queued_callers_admitted_in_order(self):
+        """Test blocked callers are admitted first-come, first-served."""
+        rate_limiter = RateLimiter(RateLimitConfig(
+            requests_per_minute=1200,  # 1 token every 50ms
+            burst_limit=1,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
+        ))
+        admitted = []
+
+        async def caller(index):
+            assert await rate_limiter.acquire(timeout=1.0)
+            admitted.append(index)
+
+        await asyncio.gather(*(caller(i) for i in range(4)))
+
+        assert admitted == [0, 1, 2, 3]
+
 
 class TestRateLimitedModel:
     """Test rate-limited model wrapper."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_rate_limited_model(self):
         """Test rate-limited model functionality."""
+        from src.oni_ai_agents.models.local_model import LocalModel
+
         # Create a local model
         local_model = LocalModel({"delay": 0.01})
         
@@ -151,12 +193,14 @@ class TestRateLimitedModel:
             assert response is not None
         
         # 4th request should fail due to rate limiting
-        with pytest.raises(Exception, match="Rate limit exceeded"):
+        with pytest.raises(RateLimitExceeded):
             await rate_limited_model.generate_response("Test prompt")
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_rate_limited_model_info(self):
         """Test rate-limited model info includes rate limiter status."""
+        from src.oni_ai_agents.models.local_model import LocalModel
+
         local_model = LocalModel({"delay": 0.01})
         rate_limiter = RateLimiter(RateLimitConfig(requests_per_minute=10))
         rate_limited_model = RateLimitedModel(local_model, rate_limiter)
@@ -168,7 +212,7 @@ class TestRateLimitedModel:
         assert "current_burst" in info["rate_limiter_status"]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_model_factory_with_rate_limiting():
     """Test model factory with rate limiting configuration."""
     from src.oni_ai_agents.models.model_factory import ModelFactory
@@ -194,11 +238,11 @@ async def test_model_factory_with_rate_limiting():
         assert response is not None
     
     # 4th request should fail due to rate limiting
-    with pytest.raises(Exception, match="Rate limit exceeded"):
+    with pytest.raises(RateLimitExceeded):
         await model.generate_response("Test prompt")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_concurrent_rate_limiting():
     """Test rate limiting with concurrent requests."""
     config = RateLimitConfig(
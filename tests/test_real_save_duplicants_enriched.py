@@ -6,20 +6,19 @@ Validates that the `SaveFileDataExtractor` exposes a `duplicants.list` with
 identity, role, extended vitals, and normalized aptitudes.
 """
 
-from pathlib import Path
 from typing import Dict
 
-import pytest
+# Allowed aptitude groups and max levels based on game tiers
+MAX_APTITUDE_LEVEL: Dict[str, int] = {
+    'Mining': 3, 'Building': 3, 'Farming': 3, 'Ranching': 2,
+    'Research': 3, 'Cooking': 2, 'Art': 3, 'Hauling': 2,
+    'Suits': 1, 'Technicals': 2, 'Engineering': 1,
+    'Basekeeping': 2, 'Management': 2, 'MedicalAid': 3,
+}
 
-from src.oni_ai_agents.services.save_file_data_extractor import SaveFileDataExtractor
 
-SAVE_PATH = Path("test_data/clone_laboratory.sav")
-
-
-@pytest.mark.skipif(not SAVE_PATH.exists(), reason="Real save file not present")
-def test_enriched_duplicants_section_contract():
-    extractor = SaveFileDataExtractor()
-    data = extractor.parse_save_file(SAVE_PATH)
+def test_enriched_duplicants_section_contract(extracted_clone_lab):
+    data = extracted_clone_lab
 
     dups_section = data.sections.get("duplicants")
     assert isinstance(dups_section, dict)
@@ -29,14 +28,6 @@ def test_enriched_duplicants_section_contract():
     assert isinstance(dlist, list)
     assert len(dlist) == dups_section["count"]
 
-    # Allowed aptitude groups and max levels based on game tiers
-    max_level: Dict[str, int] = {
-        'Mining': 3, 'Building': 3, 'Farming': 3, 'Ranching': 2,
-        'Research': 3, 'Cooking': 2, 'Art': 3, 'Hauling': 2,
-        'Suits': 1, 'Technicals': 2, 'Engineering': 1,
-        'Basekeeping': 2, 'Management': 2, 'MedicalAid': 3,
-    }
-
     saw_non_default_role = False
 
     for e in dlist:
@@ -60,8 +51,9 @@ def test_enriched_duplicants_section_contract():
         ap = e.get("aptitudes") or {}
         assert isinstance(ap, dict)
         for g, lvl in ap.items():
-            assert g in max_level, f"Unexpected aptitude group: {g}"
-            assert isinstance(lvl, int) and 1 <= lvl <= max_level[g], f"Invalid level for {g}: {lvl}"
+            cap = MAX_APTITUDE_LEVEL.get(g)
+            assert cap is not None, f"Unexpected aptitude group: {g}"
+            assert isinstance(lvl, int) and 1 <= lvl <= cap, f"Invalid level for {g}: {lvl}"
 
         # Traits/Effects keys present (may be empty lists)
         assert isinstance(e.get("traits", []), list)
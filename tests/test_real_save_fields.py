@@ -1,6 +1,12 @@
 import json
 from pathlib import Path
 
+DUPLICANT_REQUIRED_KEYS = frozenset({"x", "y", "z", "name", "gender", "arrival_time", "job", "vitals"})
+VITALS_REQUIRED_KEYS = frozenset({
+    "calories", "stamina", "stress", "decor", "temperature",
+    "breath", "bladder", "immune_level", "toxicity", "radiation_balance",
+})
+
 
 def test_real_save_generated_fields_present():
     """Validate that the generated parse_results.json contains expected fields and non-null values."""
@@ -21,28 +27,30 @@ def test_real_save_generated_fields_present():
     assert isinstance(dups, list) and len(dups) > 0
 
     for d in dups:
-        # required basic fields
-        assert all(k in d for k in ("x", "y", "z"))
+        # required fields, checked in one set difference
+        missing = DUPLICANT_REQUIRED_KEYS - d.keys()
+        assert not missing, f"duplicant missing {sorted(missing)}"
+
+        # position
         assert isinstance(d["x"], (int, float))
         assert isinstance(d["y"], (int, float))
         assert isinstance(d["z"], (int, float))
 
         # identity
-        assert "name" in d and isinstance(d["name"], str) and len(d["name"]) > 0
-        assert "gender" in d and d["gender"] in ("MALE", "FEMALE", "NB")
-        assert "arrival_time" in d and isinstance(d["arrival_time"], int)
+        assert isinstance(d["name"], str) and len(d["name"]) > 0
+        assert d["gender"] in ("MALE", "FEMALE", "NB")
+        assert isinstance(d["arrival_time"], int)
 
         # job defaulted when unknown
-        assert "job" in d and isinstance(d["job"], str) and len(d["job"]) > 0
+        assert isinstance(d["job"], str) and len(d["job"]) > 0
 
-        # vitals block present with numeric values in sensible ranges
-        vitals = d.get("vitals")
+        # vitals block present, including the extensions, with numeric values in sensible ranges
+        vitals = d["vitals"]
         assert isinstance(vitals, dict)
-        assert "calories" in vitals and isinstance(vitals["calories"], (int, float)) and vitals["calories"] >= 0
-        assert "stamina" in vitals and isinstance(vitals["stamina"], (int, float)) and 0 <= vitals["stamina"] <= 100
-        assert "stress" in vitals and isinstance(vitals["stress"], (int, float)) and 0 <= vitals["stress"] <= 100
-        # new vitals extensions exist
-        for key in ("decor", "temperature", "breath", "bladder", "immune_level", "toxicity", "radiation_balance"):
-            assert key in vitals
+        missing = VITALS_REQUIRED_KEYS - vitals.keys()
+        assert not missing, f"vitals missing {sorted(missing)}"
+        assert isinstance(vitals["calories"], (int, float)) and vitals["calories"] >= 0
+        assert isinstance(vitals["stamina"], (int, float)) and 0 <= vitals["stamina"] <= 100
+        assert isinstance(vitals["stress"], (int, float)) and 0 <= vitals["stress"] <= 100
 
 
@@ -8,37 +8,53 @@ and test our parser implementation.
 
 import json
 import logging
+import mmap
+import os
+import re
+import struct
 import zlib
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Optional, Union
 
-from src.oni_ai_agents.services.oni_save_parser import BinaryReader, OniSaveParser
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
+SAVE_PATH = Path("test_data/clone_laboratory.sav")
+RESULTS_FILE = Path("test_data/analysis_results/parse_results.json")
 
-def analyze_save_file_structure(file_path: Path):
+# Parser package sources; results older than any of them are regenerated
+_PARSER_DIR = Path(__file__).resolve().parents[1] / "src" / "oni_ai_agents" / "services" / "oni_save_parser"
+
+# zlib stream headers (no/default/best compression)
+_ZLIB_HEADER = re.compile(b'\x78[\x01\x9c\xda]')
+
+# Printable ASCII (0x20-0x7e), stripped with bytes.translate to test a chunk in C
+_PRINTABLE_ASCII = bytes(range(32, 127))
+
+_INT32 = struct.Struct('<i')
+
+
+def analyze_save_file_structure(file_path: Path, data: Optional[Union[bytes, memoryview]] = None):
     """Analyze the binary structure of a real ONI save file."""
     print(f"🔍 Analyzing save file structure: {file_path}")
     print(f"📁 File size: {file_path.stat().st_size:,} bytes ({file_path.stat().st_size / 1024 / 1024:.2f} MB)")
     
-    with open(file_path, 'rb') as f:
-        data = f.read()
+    if data is None:
+        data = file_path.read_bytes()
     
     print(f"\n📊 Binary Analysis:")
     
-    # Check for common patterns
-    reader = BinaryReader(data)
-    
     try:
         # Try to read what might be version info
         print(f"   First 32 bytes (hex): {data[:32].hex()}")
-        print(f"   First 32 bytes (ascii): {repr(data[:32])}")
+        print(f"   First 32 bytes (ascii): {repr(bytes(data[:32]))}")
         
         # Look for potential integer values at the beginning
-        reader.seek(0)
-        first_int = reader.read_int32()
-        second_int = reader.read_int32()
-        third_int = reader.read_int32()
-        fourth_int = reader.read_int32()
+        first_int, second_int, third_int, fourth_int = struct.unpack_from('<4i', data)
         
         print(f"   First 4 int32s: {first_int}, {second_int}, {third_int}, {fourth_int}")
         
@@ -47,11 +63,11 @@ def analyze_save_file_structure(file_path: Path):
             print(f"   💡 Potential version: {first_int}.{second_int}")
         
         # Look for string patterns (length-prefixed strings)
-        reader.seek(8)  # Skip potential version
+        # Skip potential version
         try:
-            string_length = reader.read_int32()
-            if 0 < string_length < 1000:  # Reasonable string length
-                string_data = reader.read_bytes(string_length)
+            string_length = _INT32.unpack_from(data, 8)[0]
+            if 0 < string_length < 1000 and 12 + string_length <= len(data):  # Reasonable string length
+                string_data = bytes(data[12:12 + string_length])
                 try:
                     decoded_string = string_data.decode('utf-8')
                     print(f"   📝 Potential string at offset 8: '{decoded_string}'")
@@ -63,7 +79,7 @@ def analyze_save_file_structure(file_path: Path):
         # Look for compressed data signatures
         for offset in [0, 100, 200, 500, 1000]:
             if offset < len(data) - 10:
-                chunk = data[offset:offset+10]
+                chunk = bytes(data[offset:offset+10])
                 if chunk.startswith(b'\x78\x9c') or chunk.startswith(b'\x78\xda'):
                     print(f"   🗜️  Potential zlib data at offset {offset}")
                     try:
@@ -77,21 +93,26 @@ def analyze_save_file_structure(file_path: Path):
         print(f"   ⚠️  Analysis error: {e}")
 
 
-def test_parser_with_real_file():
-    """Test our parser with the real save file."""
-    print(f"\n🤖 Testing parser with real save file...")
-    file_path = Path("test_data/clone_laboratory.sav")
-    output_dir = Path("test_data/analysis_results")
-    
-    parser = OniSaveParser()
-    result = parser.parse_save_file(file_path)
-    
-    # Create output directory
-    output_dir.mkdir(exist_ok=True)
-    
-    # Save parsing results
-    results_file = output_dir / "parse_results.json"
-    
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes; indented for reviewed artifacts, compact otherwise."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _results_up_to_date(results_file: Path, save_file: Path) -> bool:
+    """Check whether results_file is newer than the save and the parser sources."""
+    if not results_file.exists():
+        return False
+    newest_input = max(p.stat().st_mtime for p in (save_file, *_PARSER_DIR.glob("*.py")))
+    return results_file.stat().st_mtime >= newest_input
+
+
+def _build_parse_info(file_path: Path, result) -> Dict[str, Any]:
+    """Summarize a ParseResult into the parse_results.json artifact layout."""
     parse_info = {
         "timestamp": datetime.now().isoformat(),
         "file_path": str(file_path),
@@ -129,22 +150,66 @@ def test_parser_with_real_file():
         parse_info["entities"] = result.entities
     except Exception:
         pass
+    
+    return parse_info
+
 
-    # Save results to file
-    with open(results_file, 'w') as f:
-        json.dump(parse_info, f, indent=2)
+def _write_parse_results(results_file: Path, parse_info: Dict[str, Any]) -> None:
+    """Save results to file; write then rename so a partial file never looks fresh."""
+    results_file.parent.mkdir(exist_ok=True)
+    # Kept indented: the file is checked in and reviewed in diffs
+    tmp_file = results_file.with_suffix('.tmp')
+    tmp_file.write_bytes(_dumps(parse_info, indent=True))
+    tmp_file.replace(results_file)
     
     print(f"💾 Results saved to: {results_file}")
+
+
+def test_parser_with_real_file(parsed_clone_lab, keep_artifacts):
+    """Test our parser with the real save file."""
+    print(f"\n🤖 Testing parser with real save file...")
+    results_file = RESULTS_FILE
     
-    return result
+    # The session fixture parses the save once and skips when it is missing
+    result = parsed_clone_lab
+    parse_info = _build_parse_info(SAVE_PATH, result)
+    
+    assert result.success, result.error_message
+    assert result.save_game is not None
+    
+    # Only rewrite the artifact when asked to (--keep-artifacts) and stale
+    if keep_artifacts and not _results_up_to_date(results_file, SAVE_PATH):
+        _write_parse_results(results_file, parse_info)
 
 
-def enhanced_binary_analysis(file_path: Path, output_dir: Path):
+def run_parser_on_real_file(file_path: Path, results_file: Path) -> Dict[str, Any]:
+    """Parse the real save, reusing parse_results.json while it is up to date."""
+    print(f"\n🤖 Testing parser with real save file...")
+    
+    # Skip the parse when neither the save nor the parser changed since last run
+    if _results_up_to_date(results_file, file_path):
+        print(f"♻️  Reusing up-to-date results: {results_file}")
+        return json.loads(results_file.read_text())
+    
+    # Imported lazily so collecting or skipping this module never loads the parser
+    from src.oni_ai_agents.services.oni_save_parser import OniSaveParser
+    
+    result = OniSaveParser().parse_save_file(file_path)
+    parse_info = _build_parse_info(file_path, result)
+    _write_parse_results(results_file, parse_info)
+    return parse_info
+
+
+def enhanced_binary_analysis(
+    file_path: Path,
+    output_dir: Path,
+    data: Optional[Union[bytes, memoryview]] = None
+):
     """Enhanced binary analysis to understand the save format better."""
     print(f"\n🔬 Enhanced Binary Analysis...")
     
-    with open(file_path, 'rb') as f:
-        data = f.read()
+    if data is None:
+        data = file_path.read_bytes()
     
     analysis = {
         "file_size": len(data),
@@ -154,79 +219,65 @@ def enhanced_binary_analysis(file_path: Path, output_dir: Path):
         "compression_analysis": []
     }
     
-    # Byte frequency analysis
-    byte_counts = [0] * 256
-    for byte in data:
-        byte_counts[byte] += 1
+    # Byte frequency analysis (Counter tallies the buffer in C)
+    byte_counts = Counter(data)
     
-    # Find most common bytes
-    common_bytes = sorted(enumerate(byte_counts), key=lambda x: x[1], reverse=True)[:10]
+    # Find most common bytes, lowest byte value first on ties
+    common_bytes = sorted(byte_counts.items(), key=lambda x: (-x[1], x[0]))[:10]
     analysis["byte_distribution"] = {
         f"0x{byte:02x}": count for byte, count in common_bytes
     }
     
-    # Look for repeating patterns
-    reader = BinaryReader(data)
-    
     # Scan for potential string tables or repeated structures
-    for offset in range(0, min(len(data), 10000), 4):
-        try:
-            reader.seek(offset)
-            potential_length = reader.read_int32()
-            
-            if 4 <= potential_length <= 1000:  # Reasonable string/data length
-                try:
-                    chunk = reader.read_bytes(potential_length)
-                    if all(32 <= b <= 126 for b in chunk):  # Printable ASCII
-                        try:
-                            decoded = chunk.decode('utf-8')
-                            analysis["potential_structures"].append({
-                                "offset": offset,
-                                "type": "string",
-                                "length": potential_length,
-                                "content": decoded[:100]  # First 100 chars
-                            })
-                        except:
-                            pass
-                except:
-                    pass
-        except:
-            pass
+    read_int32 = _INT32.unpack_from
+    for offset in range(0, min(len(data) - 3, 10000), 4):
+        potential_length = read_int32(data, offset)[0]
+        start = offset + 4
+        
+        # Reasonable string/data length that fits in the file
+        if 4 <= potential_length <= 1000 and start + potential_length <= len(data):
+            chunk = bytes(data[start:start + potential_length])
+            if not chunk.translate(None, _PRINTABLE_ASCII):  # Printable ASCII
+                analysis["potential_structures"].append({
+                    "offset": offset,
+                    "type": "string",
+                    "length": potential_length,
+                    "content": chunk[:100].decode('ascii')  # First 100 chars
+                })
     
-    # Look for compressed sections
-    for offset in range(0, len(data) - 100, 100):
-        chunk = data[offset:offset+100]
+    # Look for compressed sections at every zlib header in the file,
+    # decompressing straight from the buffer without copying candidates
+    view = memoryview(data)
+    for match in _ZLIB_HEADER.finditer(data):
+        offset = match.start()
+        candidate = view[offset:offset + 50000]
+        decompressor = zlib.decompressobj()
+        try:
+            decompressed = decompressor.decompress(candidate)
+        except zlib.error:
+            continue
+        if not decompressor.eof:
+            continue  # Stream does not end within the candidate window
         
-        # Check for zlib headers
-        for i in range(len(chunk) - 2):
-            if chunk[i:i+2] in [b'\x78\x9c', b'\x78\xda', b'\x78\x01']:
-                try:
-                    remaining_data = data[offset+i:]
-                    decompressed = zlib.decompress(remaining_data[:min(len(remaining_data), 50000)])
-                    
-                    analysis["compression_analysis"].append({
-                        "offset": offset + i,
-                        "compressed_size": "unknown",
-                        "decompressed_size": len(decompressed),
-                        "compression_ratio": "unknown",
-                        "header": chunk[i:i+10].hex()
-                    })
-                    
-                    print(f"   🗜️  Found compressed section at offset {offset + i}")
-                    print(f"      Decompressed size: {len(decompressed):,} bytes")
-                    
-                    # Analyze decompressed data
-                    if len(decompressed) > 100:
-                        print(f"      First 100 bytes: {decompressed[:100]}")
-                    
-                    break  # Only find first compression in this chunk
-                except:
-                    pass
+        compressed_size = len(candidate) - len(decompressor.unused_data)
+        analysis["compression_analysis"].append({
+            "offset": offset,
+            "compressed_size": compressed_size,
+            "decompressed_size": len(decompressed),
+            "compression_ratio": round(len(decompressed) / compressed_size, 2),
+            "header": data[offset:offset + 10].hex()
+        })
+        
+        print(f"   🗜️  Found compressed section at offset {offset}")
+        print(f"      Decompressed size: {len(decompressed):,} bytes")
+        
+        # Analyze decompressed data
+        if len(decompressed) > 100:
+            print(f"      First 100 bytes: {decompressed[:100]}")
     
     # Save detailed analysis
     analysis_file = output_dir / "binary_analysis.json"
-    with open(analysis_file, 'w') as f:
-        json.dump(analysis, f, indent=2)
+    analysis_file.write_bytes(_dumps(analysis))
     
     print(f"💾 Binary analysis saved to: {analysis_file}")
     
@@ -235,13 +286,14 @@ def enhanced_binary_analysis(file_path: Path, output_dir: Path):
 
 def main():
     """Main analysis function."""
-    logging.basicConfig(level=logging.INFO)
+    # Parser INFO logs are opt-in, e.g. ONI_LOG_LEVEL=INFO
+    logging.basicConfig(level=os.environ.get("ONI_LOG_LEVEL", "WARNING"))
     
     print("🔬 Real ONI Save File Analysis")
     print("=" * 50)
     
     # File paths
-    save_file = Path("test_data/clone_laboratory.sav")
+    save_file = SAVE_PATH
     output_dir = Path("test_data/analysis_results")
     
     if not save_file.exists():
@@ -253,27 +305,31 @@ def main():
     output_dir.mkdir(exist_ok=True)
     
     try:
-        # Step 1: Basic structure analysis
-        analyze_save_file_structure(save_file)
-        
-        # Step 2: Test our parser
-        parser_result = test_parser_with_real_file(save_file, output_dir)
-        
-        # Step 3: Enhanced binary analysis
-        binary_analysis = enhanced_binary_analysis(save_file, output_dir)
+        # Map the save once and share it between the analysis passes
+        with open(save_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as data:
+            # Step 1: Basic structure analysis
+            analyze_save_file_structure(save_file, data)
+            
+            # Step 2: Test our parser
+            parser_result = run_parser_on_real_file(save_file, RESULTS_FILE)
+            
+            # Step 3: Enhanced binary analysis
+            binary_analysis = enhanced_binary_analysis(save_file, output_dir, data)
         
         # Step 4: Summary
         print(f"\n📋 Analysis Summary:")
         print(f"   File analyzed: {save_file}")
         print(f"   File size: {save_file.stat().st_size:,} bytes")
-        print(f"   Parser success: {parser_result.success}")
-        print(f"   Warnings: {len(parser_result.warnings)}")
+        print(f"   Parser success: {parser_result['success']}")
+        print(f"   Warnings: {len(parser_result['warnings'])}")
         print(f"   Output directory: {output_dir}")
         print(f"   Potential strings found: {len(binary_analysis.get('potential_structures', []))}")
         print(f"   Compressed sections: {len(binary_analysis.get('compression_analysis', []))}")
         
         print(f"\n🎯 Next Steps:")
-        if not parser_result.success:
+        if not parser_result['success']:
             print(f"   1. Review binary structure analysis")
             print(f"   2. Compare with RoboPhred's parser format")
             print(f"   3. Implement proper header parsing")
@@ -5,19 +5,10 @@ Contract tests for SaveFileDataExtractor sections schema.
 Checks that the duplicants section exposes expected keys and types.
 """
 
-from pathlib import Path
 
-from src.oni_ai_agents.services.save_file_data_extractor import SaveFileDataExtractor
-
-
-def test_extractor_duplicants_schema_types(tmp_path: Path = Path(".")):
-    # Use real save if present; otherwise skip deep checks but ensure types
-    save = Path("test_data/clone_laboratory.sav")
-    if not save.exists():
-        return
-
-    extractor = SaveFileDataExtractor()
-    data = extractor.parse_save_file(save)
+def test_extractor_duplicants_schema_types(extracted_clone_lab):
+    # Uses the real save; the shared fixture skips when it is absent
+    data = extracted_clone_lab
 
     assert "duplicants" in data.sections
     dups = data.sections["duplicants"]
@@ -19,43 +19,34 @@ from src.oni_ai_agents.models.vision_model_factory import (
 class TestVisionModelFactory:
     """Test suite for the Vision Model Factory."""
     
-    def test_create_openai_vision_model(self):
-        """Test creating OpenAI vision model."""
-        config = {
-            "model": "gpt-4-vision-preview",
-            "api_key": "test_key",
-            "max_tokens": 1000
-        }
-        
-        model = VisionModelFactory.create("openai", config)
-        
-        assert isinstance(model, OpenAIVisionModel)
-        assert model.config == config
-    
-    def test_create_anthropic_vision_model(self):
-        """Test creating Anthropic vision model."""
-        config = {
-            "model": "claude-3-5-sonnet-20241022",
-            "api_key": "test_key",
-            "max_tokens": 1000
-        }
-        
-        model = VisionModelFactory.create("anthropic", config)
-        
-        assert isinstance(model, AnthropicVisionModel)
-        assert model.config == config
-    
-    def test_create_local_vision_model(self):
-        """Test creating local vision model."""
-        config = {
-            "model": "llava",
-            "endpoint": "http://localhost:11434",
-            "max_tokens": 1000
-        }
-        
-        model = VisionModelFactory.create("local", config)
-        
-        assert isinstance(model, LocalVisionModel)
+    @pytest.mark.parametrize(
+        "provider,expected_cls,config",
+        [
+            ("openai", OpenAIVisionModel,
+             {"model": "gpt-4-vision-preview", "api_key": "test_key", "max_tokens": 1000}),
+            ("anthropic", AnthropicVisionModel,
+             {"model": "claude-3-5-sonnet-20241022", "api_key": "test_key", "max_tokens": 1000}),
+            ("local", LocalVisionModel,
+             {"model": "llava", "endpoint": "http://localhost:11434", "max_tokens": 1000}),
+            # Same providers with a fuller, real-world configuration
+            ("openai", OpenAIVisionModel,
+             {"model": "gpt-4-vision-preview", "api_key": "test_key", "max_tokens": 1000,
+              "temperature": 0.7}),
+            ("anthropic", AnthropicVisionModel,
+             {"model": "claude-3-5-sonnet-20241022", "api_key": "test_key", "max_tokens": 1000,
+              "temperature": 0.7}),
+            ("local", LocalVisionModel,
+             {"model": "llava", "endpoint": "http://localhost:11434", "max_tokens": 1000,
+              "temperature": 0.7}),
+        ],
+        ids=["openai", "anthropic", "local",
+             "openai-integration", "anthropic-integration", "local-integration"],
+    )
+    def test_create_vision_model(self, provider, expected_cls, config):
+        """Test creating each provider's vision model with its configuration."""
+        model = VisionModelFactory.create(provider, config)
+        
+        assert isinstance(model, expected_cls)
         assert model.config == config
     
     def test_create_unsupported_provider(self):
@@ -79,6 +70,33 @@ class TestVisionModelFactory:
         assert isinstance(model, OpenAIVisionModel)
         assert model.config is None
     
+    def test_equal_configs_reuse_instance(self):
+        """Test that equal configurations share one cached model instance."""
+        VisionModelFactory.clear_cache()
+        first = VisionModelFactory.create("local", {"model": "llava", "stop": ["\n"]})
+        second = VisionModelFactory.create("local", {"stop": ["\n"], "model": "llava"})
+        other = VisionModelFactory.create("local", {"model": "bakllava"})
+        
+        assert first is second
+        assert other is not first
+        
+        VisionModelFactory.clear_cache()
+        assert VisionModelFactory.create("local", {"model": "llava", "stop": ["\n"]}) is not first
+
+    def test_cached_model_unaffected_by_caller_config_changes(self):
+        """Test that mutating the caller's config does not leak into the cache."""
+        VisionModelFactory.clear_cache()
+        config = {"model": "llava", "stop": ["\n"]}
+        first = VisionModelFactory.create("local", config)
+        config["model"] = "other"
+        config["stop"].append("###")
+
+        again = VisionModelFactory.create("local", {"model": "llava", "stop": ["\n"]})
+        assert again is first
+        assert again.config == {"model": "llava", "stop": ["\n"]}
+
+        VisionModelFactory.clear_cache()
+
     def test_supported_providers(self):
         """Test that all supported providers are listed."""
         providers = VisionModelFactory.get_supported_providers()
@@ -101,54 +119,5 @@ class TestVisionModelFactory:
         assert not VisionModelFactory.is_provider_supported(None)
 
 
-class TestVisionModelFactoryIntegration:
-    """Integration tests for the Vision Model Factory."""
-    
-    def test_openai_model_creation_integration(self):
-        """Test OpenAI model creation with real configuration."""
-        config = {
-            "model": "gpt-4-vision-preview",
-            "api_key": "test_key",
-            "max_tokens": 1000,
-            "temperature": 0.7
-        }
-        
-        model = VisionModelFactory.create("openai", config)
-        
-        # Verify model was created with correct config
-        assert isinstance(model, OpenAIVisionModel)
-        assert model.config == config
-    
-    def test_anthropic_model_creation_integration(self):
-        """Test Anthropic model creation with real configuration."""
-        config = {
-            "model": "claude-3-5-sonnet-20241022",
-            "api_key": "test_key",
-            "max_tokens": 1000,
-            "temperature": 0.7
-        }
-        
-        model = VisionModelFactory.create("anthropic", config)
-        
-        # Verify model was created with correct config
-        assert isinstance(model, AnthropicVisionModel)
-        assert model.config == config
-    
-    def test_local_model_creation_integration(self):
-        """Test local model creation with real configuration."""
-        config = {
-            "model": "llava",
-            "endpoint": "http://localhost:11434",
-            "max_tokens": 1000,
-            "temperature": 0.7
-        }
-        
-        model = VisionModelFactory.create("local", config)
-        
-        # Verify model was created with correct config
-        assert isinstance(model, LocalVisionModel)
-        assert model.config == config
-
-
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
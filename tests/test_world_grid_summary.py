@@ -1,14 +1,10 @@
-from pathlib import Path
+from array import array
 
-from src.oni_ai_agents.services.save_file_data_extractor import SaveFileDataExtractor
+from src.oni_ai_agents.services.oni_save_parser.world_grid_histogrammer import WorldGridHistograms
 
 
-def test_world_grid_summary_exists_and_has_placeholders():
-    save_path = Path("test_data/clone_laboratory.sav")
-    extractor = SaveFileDataExtractor()
-
-    data = extractor.parse_save_file(save_path)
-    sections = data.sections
+def test_world_grid_summary_exists_and_has_placeholders(extracted_clone_lab):
+    sections = extracted_clone_lab.sections
 
     assert "world_grid_summary" in sections, "world_grid_summary section missing"
     wgs = sections["world_grid_summary"]
@@ -45,3 +41,12 @@ def test_world_grid_summary_exists_and_has_placeholders():
     assert wgs["breathable_percent"] is None
 
 
+def test_world_grid_histograms_to_dict_drops_empty_bins():
+    hist = WorldGridHistograms(elements=array("q", [0, 3, 0, 7]), radiation=array("q", [2]))
+
+    assert hist.to_dict() == {
+        "elements": {"1": 3, "3": 7},
+        "temperatures": {},
+        "diseases": {},
+        "radiation": {"0": 2},
+    }
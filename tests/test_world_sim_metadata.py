@@ -1,12 +1,5 @@
-from pathlib import Path
-
-from src.oni_ai_agents.services.oni_save_parser import OniSaveParser
-
-
-def test_world_and_metadata_present():
-    save_path = Path("test_data/clone_laboratory.sav")
-    parser = OniSaveParser()
-    result = parser.parse_save_file(save_path)
+def test_world_and_metadata_present(parsed_clone_lab):
+    result = parsed_clone_lab
 
     assert result.success, f"Parser failed: {result.error_message}"
     sg = result.save_game